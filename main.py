@@ -2,10 +2,16 @@
 Main entrypoint for SMART APPLY BOT.
 This file adapts to the existing src/* implementations and uses safe fallbacks.
 """
+import re
 import sys
 import time
 import random
+import asyncio
+import logging
+import functools
 from typing import List, Dict, Optional
+from pathlib import Path
+from urllib.parse import quote_plus
 
 # Try to import config values if present (use safe defaults)
 try:
@@ -15,6 +21,13 @@ try:
         MAX_APPLICATIONS_PER_DAY,
         SEARCH_QUERIES,
         PREFERRED_LOCATIONS,
+        EXTRACT_CONCURRENCY,
+        APPLY_CONCURRENCY,
+        NAV_RATE_PER_SEC,
+        NAV_BURST,
+        BOT_DEBUG,
+        LOGS_DIR,
+        _ensure_dirs,
     )
 except Exception:
     DRY_RUN = False
@@ -22,6 +35,15 @@ except Exception:
     MAX_APPLICATIONS_PER_DAY = 20
     SEARCH_QUERIES = [ "Full Stack Intern,Frontend Intern,Web Developer Intern,React Developer Intern,Node.js Intern"]
     PREFERRED_LOCATIONS = ["India"]
+    EXTRACT_CONCURRENCY = 4
+    APPLY_CONCURRENCY = 1
+    NAV_RATE_PER_SEC, NAV_BURST = 1.0, 3
+    BOT_DEBUG = False
+    LOGS_DIR = Path("data") / "logs"
+
+    def _ensure_dirs(*dirs):
+        for folder in dirs:
+            folder.mkdir(parents=True, exist_ok=True)
 
 # Flexible imports for bot / user config / components
 try:
@@ -48,29 +70,155 @@ except Exception:
 from src.resume_manager import ResumeManager
 from src.llm_engine import LLMEngine
 from src.logger import JobLogger
+from src.cache import JobCache
+from src.ratelimit import AsyncTokenBucket
+from src.tabpool import TabPool
 from src.utils import human_sleep
 
+# ============================================================
+#  SELECTORS (hoisted so per-job loops don't rebuild them)
+# ============================================================
+
+# Try multiple selectors for title/company/description to avoid 'Unknown'
+T_SELECTORS = (
+    ".job-details-jobs-unified-top-card__job-title h1 a",  # Specific: h1 > a inside job title div
+    "h1.t-24.t-bold a",  # Class-based match for h1 > a
+    ".job-details-jobs-unified-top-card__job-title h1",  # Fallback: just the h1
+    "h1",  # Any h1 tag (usually job title)
+    ".topcard__title",
+    "h1.top-card-layout__title",
+)
+C_SELECTORS = (
+    ".job-details-jobs-unified-top-card__company-name a",  # Specific: a inside company name div
+    "div.job-details-jobs-unified-top-card__company-name a",  # More specific version
+    ".topcard__org-name-link",
+    "a[data-tracking-control-name='public_jobs_topcard-org-name']",
+    "a[href*='/company/']",  # Any company link
+)
+D_SELECTORS = (
+    ".jobs-description__content",
+    ".jobs-description-content__text",
+    "div.jobs-description",
+    "article.jobs-description",
+    ".description__text",
+    ".description",
+)
+_JOB_DETAIL_SELECTORS = {"t": T_SELECTORS, "c": C_SELECTORS, "d": D_SELECTORS}
+
+# Probes every selector list in-page; returns [text, selector] per field
+_PICK_JOB_DETAILS_JS = """(sels) => {
+    const pick = (arr) => {
+        for (const s of arr) {
+            const el = document.querySelector(s);
+            const text = el && el.innerText ? el.innerText.trim() : "";
+            if (text) return [text, s];
+        }
+        return ["", ""];
+    };
+    return {title: pick(sels.t), company: pick(sels.c), description: pick(sels.d)};
+}"""
+
+# Search result links, tried together to be robust against DOM changes
+JOB_LINK_SELECTOR = ", ".join((
+    "a.job-card-container__link",
+    "a.base-card__full-link",
+    "a.result-card__full-card-link",
+    "a[href*='/jobs/view/']",
+))
+
+# Fallback apply flow (each list pre-joined into one compound selector)
+EASY_SELECTOR = ", ".join((
+    'button.jobs-apply-button',
+    'button[aria-label*="Easy Apply"]',
+    'button:has-text("Easy Apply")',
+))
+SUBMIT_SELECTOR = ", ".join(('button:has-text("Submit")', 'button[aria-label="Submit application"]'))
+
+# Shared pace for every scraping request to LinkedIn (page loads, scrolls, guest fetches)
+_NAV_BUCKET = AsyncTokenBucket(NAV_RATE_PER_SEC, NAV_BURST)
+
+# LinkedIn search pagination and pre-encoded query parameters
+_SEARCH_PAGE_SIZE = 25
+_LOC_Q = quote_plus(PREFERRED_LOCATIONS[0] if PREFERRED_LOCATIONS else "India")
+_KEYWORD_CACHE: Dict[str, str] = {}
+
+# Logger rows are buffered and written together; the daily count is resynced on each flush
+_LOG_FLUSH_EVERY = 5
+
+
+def _search_query(keyword: str) -> str:
+    """Return the encoded ``keywords=...&location=...`` part of a search URL."""
+    q = _KEYWORD_CACHE.get(keyword)
+    if q is None:
+        q = _KEYWORD_CACHE[keyword] = quote_plus(keyword)
+    return f"keywords={q}&location={_LOC_Q}"
+
+
+# Resume lists don't change during a run; prime_resume_cache() resolves them once
+_AVAILABLE_CACHE: Optional[List[str]] = None
+_ALL_RESUMES_CACHE = None
+
+
+def prime_resume_cache(resumes: ResumeManager) -> List[str]:
+    """Snapshot the available resumes for this run and return their names."""
+    global _AVAILABLE_CACHE, _ALL_RESUMES_CACHE
+    try:
+        _AVAILABLE_CACHE = resumes.list_available_resumes()
+    except Exception:
+        _AVAILABLE_CACHE = []
+    try:
+        _ALL_RESUMES_CACHE = resumes.get_all_resumes() if hasattr(resumes, "get_all_resumes") else _AVAILABLE_CACHE
+    except Exception:
+        _ALL_RESUMES_CACHE = _AVAILABLE_CACHE
+    _select_best_resume_cached.cache_clear()
+    return _AVAILABLE_CACHE
+
+
+@functools.lru_cache(maxsize=512)
+def _select_best_resume_cached(llm, job_description: str, job_title: str):
+    """LLM resume match memoised per (description, title) within a run."""
+    return llm.select_best_resume(job_description=job_description, resumes=_ALL_RESUMES_CACHE, job_title=job_title)
 
-def choose_resume(llm: Optional[LLMEngine], resumes: ResumeManager, description: str, title: str):
+
+def choose_resume(llm: Optional[LLMEngine], resumes: ResumeManager, description: str, title: str,
+                  cache: Optional[JobCache] = None):
     """Return selected_resume_name, match_score, confidence"""
     # If only one resume is available, always use it (simple & deterministic)
     try:
-        available = resumes.list_available_resumes()
+        available = _AVAILABLE_CACHE if _AVAILABLE_CACHE is not None else resumes.list_available_resumes()
         if available and len(available) == 1:
             return available[0], 0, 1.0
     except Exception:
         pass
+    # Reuse an earlier LLM decision for the same description
+    if cache is not None:
+        try:
+            hit = cache.get_resume_choice(description or title)
+            if hit and resumes.get_resume_path(hit[0]):
+                return hit
+        except Exception:
+            pass
     try:
         if llm and hasattr(llm, "select_best_resume"):
-            all_res = resumes.get_all_resumes() if hasattr(resumes, "get_all_resumes") else resumes.list_available_resumes()
-            match = llm.select_best_resume(job_description=description or title, resumes=all_res, job_title=title)
-            return match.get("selected_resume") or match.get("selected_resume_name"), match.get("match_score", 0), match.get("confidence", 0.0)
+            if _ALL_RESUMES_CACHE is not None:
+                match = _select_best_resume_cached(llm, description or title, title)
+            else:
+                all_res = resumes.get_all_resumes() if hasattr(resumes, "get_all_resumes") else resumes.list_available_resumes()
+                match = llm.select_best_resume(job_description=description or title, resumes=all_res, job_title=title)
+            selected = match.get("selected_resume") or match.get("selected_resume_name")
+            score, confidence = match.get("match_score", 0), match.get("confidence", 0.0)
+            if cache is not None and selected:
+                try:
+                    cache.put_resume_choice(description or title, selected, score, confidence)
+                except Exception:
+                    pass
+            return selected, score, confidence
     except Exception:
         pass
 
     # fallback: pick first available resume
     try:
-        list_res = resumes.list_available_resumes()
+        list_res = _AVAILABLE_CACHE if _AVAILABLE_CACHE is not None else resumes.list_available_resumes()
     except Exception:
         list_res = []
     if not list_res:
@@ -83,147 +231,125 @@ def choose_resume(llm: Optional[LLMEngine], resumes: ResumeManager, description:
     return selected, 0, 0.0
 
 
-def apply_with_bot(bot, url: str, resume_path: str):
+async def apply_with_bot(bot, url: str, resume_path: str, page=None):
     """
     Try common apply API names on bot: apply_to_job, apply_to_linkedin_job, apply.
     If none exist, open page and try a minimal 'click Easy Apply' flow using page.
+    ``page`` selects the tab to use (defaults to the bot's main page).
     Returns result string or boolean.
     """
     try:
         if hasattr(bot, "apply_to_job"):
-            return bot.apply_to_job(url, resume_path)
+            if page is not None:
+                return await bot.apply_to_job(url, resume_path, page=page)
+            return await bot.apply_to_job(url, resume_path)
         if hasattr(bot, "apply_to_linkedin_job"):
             # expects job_data sometimes; create minimal job dict
             job = {"url": url, "description": ""}
-            return bot.apply_to_linkedin_job(job, resume_path)
+            return await bot.apply_to_linkedin_job(job, resume_path)
         if hasattr(bot, "apply"):
-            return bot.apply(url, resume_path)
+            return await bot.apply(url, resume_path)
     except Exception as e:
         print("⚠️ Bot apply method raised:", e)
 
     # Last resort: open URL and attempt to click Easy Apply using page API
     try:
-        page = getattr(bot, "page", None)
+        page = page or getattr(bot, "page", None)
         if page is None:
             return False
-        page.goto(url, timeout=60000)
-        human_sleep(1, 2)
-        # try a few selectors
-        easy_selectors = [
-            'button.jobs-apply-button',
-            'button[aria-label*="Easy Apply"]',
-            'button:has-text("Easy Apply")'
-        ]
-        for sel in easy_selectors:
+        await page.goto(url, timeout=60000)
+        await human_sleep(1, 2)
+        can_upload = hasattr(bot, "upload_file")
+        loc = page.locator(EASY_SELECTOR)
+        if await loc.count() > 0:
+            await loc.first.click()
+            await human_sleep(0.3, 0.6)
+            # attempt upload if file input present and bot has upload helper
+            if can_upload:
+                try:
+                    file_in = page.locator('input[type="file"]')
+                    if await file_in.count() > 0:
+                        await bot.upload_file('input[type="file"]', resume_path)
+                        await human_sleep(0.5, 1)
+                except Exception:
+                    pass
+            # try to submit
             try:
-                loc = page.locator(sel)
-                if loc.count() > 0:
-                    loc.first.click()
-                    human_sleep(0.3, 0.6)
-                    # attempt upload if file input present and bot has upload helper
-                    if hasattr(bot, "upload_file"):
-                        try:
-                            file_in = page.locator('input[type="file"]')
-                            if file_in.count() > 0:
-                                bot.upload_file('input[type="file"]', resume_path)
-                                human_sleep(0.5, 1)
-                        except Exception:
-                            pass
-                    # try to submit
-                    submit_sel = ['button:has-text("Submit")', 'button[aria-label="Submit application"]']
-                    for s in submit_sel:
-                        try:
-                            s_loc = page.locator(s)
-                            if s_loc.count() > 0:
-                                s_loc.first.click()
-                                human_sleep(0.5, 1)
-                                return True
-                        except Exception:
-                            continue
-                    return True
+                s_loc = page.locator(SUBMIT_SELECTOR)
+                if await s_loc.count() > 0:
+                    await s_loc.first.click()
+                    await human_sleep(0.5, 1)
             except Exception:
-                continue
+                pass
+            return True
     except Exception as e:
         print("⚠️ Fallback apply flow failed:", e)
     return False
 
 
-def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: int = 50) -> List[str]:
+async def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: int = 50,
+                                   skip_urls=None) -> List[str]:
     """Lightweight job URL scraper using bot.page. Returns unique URLs.
 
     This version navigates directly to the LinkedIn search URL (more reliable),
     collects links using several common selectors, and saves an HTML snapshot
-    for diagnostics when no jobs are found.
+    for diagnostics when no jobs are found. URLs in ``skip_urls`` (e.g. jobs
+    already in the tracker) are dropped during de-duplication.
     """
-    from urllib.parse import quote_plus
-
     page = getattr(bot, "page", None)
     if page is None:
         return []
 
     try:
         # Build a direct search URL with Easy Apply filter enabled
-        q = quote_plus(keyword)
-        loc = quote_plus(keyword if not PREFERRED_LOCATIONS else PREFERRED_LOCATIONS[0])
-        search_url = f"https://www.linkedin.com/jobs/search/?keywords={q}&location={loc}&f_AL=true"
-        page.goto(search_url, wait_until="domcontentloaded")
-        human_sleep(1, 2)
-
-        # Scroll to load more results
-        for _ in range(4):
-            try:
-                page.evaluate("window.scrollBy(0, window.innerHeight);")
-            except Exception:
-                pass
-            human_sleep(0.5, 1)
-
-        # Try several link selectors to be robust against DOM changes
-        candidate_selectors = [
-            "a.job-card-container__link",
-            "a.base-card__full-link",
-            "a.result-card__full-card-link",
-            "a[href*='/jobs/view/']",
-        ]
-
-        urls = []
-        for sel in candidate_selectors:
-            try:
-                elems = page.locator(sel).all()
-            except Exception:
-                elems = []
-            for el in elems:
+        base = f"https://www.linkedin.com/jobs/search/?{_search_query(keyword)}&f_AL=true"
+        seen = set(skip_urls or ())
+        unique = []
+
+        # Walk result pages (25 cards each) until we have enough URLs
+        pages = max(1, -(-max_urls // _SEARCH_PAGE_SIZE))
+        for page_num in range(pages):
+            await _NAV_BUCKET.acquire()
+            await page.goto(f"{base}&start={page_num * _SEARCH_PAGE_SIZE}", wait_until="domcontentloaded")
+
+            # Scroll to load more results (paced by the bucket, which also gives cards time to render)
+            for _ in range(4):
+                await _NAV_BUCKET.acquire()
                 try:
-                    href = el.get_attribute("href")
-                    if not href:
-                        continue
-                    clean = href.split("?")[0]
-                    if not clean.startswith("http"):
-                        clean = f"https://www.linkedin.com{clean}"
-                    urls.append(clean)
-                    if len(urls) >= max_urls:
-                        break
+                    await page.evaluate("window.scrollBy(0, window.innerHeight);")
                 except Exception:
-                    continue
-            if len(urls) >= max_urls:
-                break
+                    pass
 
-        # Unique preserve order
-        seen = set()
-        unique = []
-        for u in urls:
-            if u not in seen:
-                seen.add(u)
-                unique.append(u)
-            if len(unique) >= max_urls:
+            # One selector list -> one in-page pass over all matching anchors.
+            # e.href is already absolute, so normalisation is just dropping the query.
+            try:
+                hrefs = await page.locator(JOB_LINK_SELECTOR).evaluate_all("els => els.map(e => e.href)")
+            except Exception:
+                hrefs = []
+
+            # Unique preserve order (also filters previously applied URLs)
+            found = 0
+            for href in hrefs:
+                if not href:
+                    continue
+                clean = href.split("?")[0]
+                if clean not in seen:
+                    seen.add(clean)
+                    unique.append(clean)
+                    found += 1
+                if len(unique) >= max_urls:
+                    break
+            if not found or len(unique) >= max_urls:
                 break
 
         if not unique:
             # Save diagnostic HTML snapshot for inspection
             try:
                 ts = int(time.time())
-                html_path = f"data/logs/no_jobs_{ts}.html"
+                _ensure_dirs(LOGS_DIR)
+                html_path = LOGS_DIR / f"no_jobs_{ts}.html"
                 with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(page.content())
+                    f.write(await page.content())
                 print(f"📄 Saved page HTML for inspection: {html_path}")
             except Exception:
                 pass
@@ -233,7 +359,177 @@ def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: i
         return []
 
 
-def main(max_jobs: int = 10):
+# Job ids inside the card fragments returned by LinkedIn's guest search endpoint
+_GUEST_JOB_ID_RE = re.compile(r'urn:li:jobPosting:(\d+)')
+
+
+async def scrape_job_urls_http(bot, keyword: str, max_urls: int = 50, skip_urls=None) -> List[str]:
+    """Fetch job URLs from LinkedIn's guest search endpoint without rendering a page.
+
+    Result pages (25 cards each) are requested in parallel through the bot
+    context's HTTP client, which shares the browser's cookies. Returns an
+    empty list on any error or rate limit so callers can fall back to
+    scrape_job_urls_with_bot.
+    """
+    context = getattr(bot, "browser", None)
+    request = getattr(context, "request", None)
+    if request is None:
+        return []
+
+    base = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?{_search_query(keyword)}&f_AL=true"
+    pages = max(1, -(-max_urls // _SEARCH_PAGE_SIZE))
+
+    async def fetch(start: int) -> str:
+        await _NAV_BUCKET.acquire()
+        resp = await request.get(f"{base}&start={start}", timeout=20000)
+        if resp.status == 429:
+            print("⚠️ Guest search endpoint rate-limited (429)")
+            return ""
+        return await resp.text() if resp.ok else ""
+
+    try:
+        fragments = await asyncio.gather(*(fetch(i * _SEARCH_PAGE_SIZE) for i in range(pages)))
+    except Exception as e:
+        print("⚠️ Guest search request failed:", e)
+        return []
+
+    seen = set(skip_urls or ())
+    unique = []
+    for html in fragments:
+        for job_id in _GUEST_JOB_ID_RE.findall(html):
+            url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+            if url not in seen:
+                seen.add(url)
+                unique.append(url)
+    return unique[:max_urls]
+
+
+async def collect_job_urls(bot, queries: List[str], max_urls: int, skip_urls=None) -> List[str]:
+    """Scrape each search query in turn and merge the results (order kept, no duplicates).
+
+    The lightweight guest endpoint is tried first; the rendered search page
+    is only driven when it returns nothing.
+    """
+    merged: Dict[str, None] = {}
+    for keyword in queries:
+        print(f"\n🔍 Scraping jobs for: {keyword}")
+        urls = await scrape_job_urls_http(bot, keyword=keyword, max_urls=max_urls, skip_urls=skip_urls)
+        if not urls:
+            urls = await scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_urls, skip_urls=skip_urls)
+        merged.update(dict.fromkeys(urls))
+        if len(merged) >= max_urls:
+            break
+    return list(merged)[:max_urls]
+
+
+async def extract_job_details(page, url: str) -> Dict[str, str]:
+    """Open a job page and pull title/company/description in one evaluate call."""
+    job = {"url": url, "title": "Unknown", "company": "Unknown", "description": ""}
+    if page is None:
+        return job
+    try:
+        await _NAV_BUCKET.acquire()
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+
+        # The top card renders after DOMContentLoaded; give it a moment
+        try:
+            await page.wait_for_selector("h1", timeout=10000)
+        except Exception:
+            pass
+
+        # Probe all selector lists in-page with a single evaluate call
+        data = await page.evaluate(_PICK_JOB_DETAILS_JS, _JOB_DETAIL_SELECTORS)
+        title, t_sel = data["title"]
+        company, c_sel = data["company"]
+        if title:
+            job["title"] = title
+            print(f"✓ Title found with selector: {t_sel[:50]}")
+        else:
+            print(f"⚠️ Could not extract job title for {url} - will try all selectors on next run")
+        if company:
+            job["company"] = company
+            print(f"✓ Company found with selector: {c_sel[:50]}")
+        job["description"] = data["description"][0]
+    except Exception as e:
+        print(f"⚠️ Could not load/extract page {url}:", e)
+    return job
+
+
+async def extract_all_jobs(bot, job_urls: List[str], concurrency: int = EXTRACT_CONCURRENCY,
+                           cache: Optional[JobCache] = None) -> List[Dict[str, str]]:
+    """Extract job details for every URL using a small pool of tabs.
+
+    The bot's persistent context holds the LinkedIn session, so extra tabs are
+    opened on that context (rather than fresh contexts) to share its cookies.
+    URLs with fresh entries in ``cache`` are not loaded at all.
+    """
+    cached = {}
+    if cache is not None:
+        for url in job_urls:
+            hit = cache.get_job(url)
+            if hit:
+                cached[url] = hit
+        if cached:
+            print(f"🗃️ {len(cached)} job(s) loaded from cache")
+    to_fetch = [u for u in job_urls if u not in cached]
+    if not to_fetch:
+        return [cached[u] for u in job_urls]
+
+    context = getattr(bot, "browser", None)
+    main_page = getattr(bot, "page", None)
+    pool = TabPool([main_page] if main_page is not None else [])
+    # bot.new_page gives every tab the bot's timeouts (same as the apply tabs)
+    open_tab = getattr(bot, "new_page", None) or getattr(context, "new_page", None)
+    if context is not None and open_tab is not None:
+        await pool.grow(open_tab, min(concurrency, len(to_fetch)))
+    if not pool.size:
+        return [cached.get(url) or await extract_job_details(None, url) for url in job_urls]
+
+    async def process_job(url: str) -> Dict[str, str]:
+        async with pool.page() as page:
+            return await extract_job_details(page, url)
+
+    try:
+        fetched = await asyncio.gather(*(process_job(u) for u in to_fetch))
+    finally:
+        await pool.close()
+
+    if cache is not None:
+        for job in fetched:
+            if job["title"] != "Unknown":
+                try:
+                    cache.put_job(job)
+                except Exception:
+                    pass
+    by_url = dict(cached)
+    by_url.update((job["url"], job) for job in fetched)
+    return [by_url[u] for u in job_urls]
+
+
+async def match_all_jobs(llm: Optional[LLMEngine], resumes: ResumeManager, jobs: List[Dict[str, str]],
+                         available_resumes: List[str], cache: Optional[JobCache] = None):
+    """Attach ``(selected_resume, score, confidence)`` to every job under the ``"resume"`` key.
+
+    The LLM calls are blocking HTTP requests, so they run on the default thread
+    pool and overlap each other instead of stalling the apply loop one by one.
+    """
+    # With a single resume every job gets the same answer - skip the matcher entirely
+    if len(available_resumes) == 1:
+        for job in jobs:
+            job["resume"] = (available_resumes[0], 0, 1.0)
+        return jobs
+
+    loop = asyncio.get_running_loop()
+    choices = await asyncio.gather(*(
+        loop.run_in_executor(None, choose_resume, llm, resumes, job["description"], job["title"], cache)
+        for job in jobs
+    ))
+    for job, choice in zip(jobs, choices):
+        job["resume"] = choice
+    return jobs
+
+
+async def main(max_jobs: int = 10, refresh: bool = False):
     print("\n" + "=" * 60)
     print("🤖 SMART APPLY - MAIN")
     print("=" * 60)
@@ -249,41 +545,51 @@ def main(max_jobs: int = 10):
 
     # initialize components
     resumes = ResumeManager()
+    available_resumes = prime_resume_cache(resumes)
     try:
         llm = LLMEngine()
     except Exception as e:
         print("⚠️ LLMEngine init failed:", e)
         llm = None
     logger = JobLogger()
+    # --refresh bypasses cached job details and resume selections
+    cache = None if refresh else JobCache()
 
     bot = None
+    pending_rows: List[Dict] = []
     try:
         bot = _BotClass(headless=HEADLESS_MODE)
         # try common launch names
         if hasattr(bot, "start_browser"):
-            bot.start_browser()
+            await bot.start_browser()
         elif hasattr(bot, "launch"):
-            bot.launch()
+            await bot.launch()
         elif hasattr(bot, "open"):
-            bot.open()
+            await bot.open()
         # small pause for browser readiness
-            human_sleep(0.5, 1)
+            await human_sleep(0.5, 1)
     except Exception as e:
         print("❌ Failed to start bot:", e)
         if bot:
             try:
-                bot.close()
+                await bot.close()
             except Exception:
                 pass
         sys.exit(1)
 
     try:
-        # choose search query & location
-        keyword = SEARCH_QUERIES[0] if SEARCH_QUERIES else "Python Developer"
+        # search every configured query & location
+        queries = SEARCH_QUERIES or ["Python Developer"]
         location = PREFERRED_LOCATIONS[0] if PREFERRED_LOCATIONS else "India"
 
-        print(f"\n🔍 Scraping jobs for: {keyword} in {location}")
-        job_urls = scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
+        # never revisit jobs that are already in the tracker
+        try:
+            applied_urls = set(logger.get_applied_urls())
+        except Exception:
+            applied_urls = set()
+
+        print(f"\n🔍 Scraping {len(queries)} search queries in {location}")
+        job_urls = await collect_job_urls(bot, queries, max_jobs, skip_urls=applied_urls)
         # If no job URLs found, allow a manual retry when running headful so you can login/inspect
         if not job_urls:
             print("❌ No job URLs found.")
@@ -293,9 +599,10 @@ def main(max_jobs: int = 10):
                     page = getattr(bot, "page", None)
                     if page:
                         ts = int(time.time())
-                        path = f"data/logs/no_jobs_{ts}.png"
+                        _ensure_dirs(LOGS_DIR)
+                        path = LOGS_DIR / f"no_jobs_{ts}.png"
                         try:
-                            page.screenshot(path=path, full_page=True)
+                            await page.screenshot(path=path, full_page=True)
                             print(f"📸 Saved screenshot for inspection: {path}")
                         except Exception:
                             pass
@@ -307,7 +614,7 @@ def main(max_jobs: int = 10):
                     resp = input("No jobs found — log in if needed. Type 'r' then Enter to retry scraping, or just press Enter to exit: ")
                     if resp.strip().lower() == 'r':
                         print("🔁 Retrying scrape after manual action...")
-                        job_urls = scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
+                        job_urls = await collect_job_urls(bot, queries, max_jobs, skip_urls=applied_urls)
                         if not job_urls:
                             print("❌ Still no job URLs found after retry. Exiting.")
                             return
@@ -323,103 +630,54 @@ def main(max_jobs: int = 10):
 
         print(f"📋 Found {len(job_urls)} jobs (processing up to {max_jobs})")
 
+        # Phase 1: load every job page concurrently and extract its details
+        jobs = await extract_all_jobs(bot, job_urls[:max_jobs], cache=cache)
+
+        # Phase 2: pick a resume for every job up front (LLM calls run concurrently)
+        await match_all_jobs(llm, resumes, jobs, available_resumes, cache)
+
+        # Phase 3: apply through a pool of tabs (APPLY_CONCURRENCY=1 keeps it one job at a time)
         applied_count = 0
-        for idx, url in enumerate(job_urls[:max_jobs], start=1):
-            print("\n" + "-" * 60)
-            print(f"📍 Job {idx}/{min(len(job_urls), max_jobs)}")
-            print(url)
-            # load job page & try to extract useful info
-            page = getattr(bot, "page", None)
-            title = "Unknown"
-            company = "Unknown"
-            description = ""
-            if page is not None:
-                try:
-                    page.goto(url, timeout=60000)
-                    human_sleep(1, 2)
-                    
-                    # Try multiple selectors for title/company/description to avoid 'Unknown'
-                    t_selectors = [
-                        ".job-details-jobs-unified-top-card__job-title h1 a",  # Specific: h1 > a inside job title div
-                        "h1.t-24.t-bold a",  # Class-based match for h1 > a
-                        ".job-details-jobs-unified-top-card__job-title h1",  # Fallback: just the h1
-                        "h1",  # Any h1 tag (usually job title)
-                        ".topcard__title",
-                        "h1.top-card-layout__title",
-                    ]
-                    c_selectors = [
-                        ".job-details-jobs-unified-top-card__company-name a",  # Specific: a inside company name div
-                        "div.job-details-jobs-unified-top-card__company-name a",  # More specific version
-                        ".topcard__org-name-link",
-                        "a[data-tracking-control-name='public_jobs_topcard-org-name']",
-                        "a[href*='/company/']",  # Any company link
-                    ]
-                    d_selectors = [
-                        ".jobs-description__content",
-                        ".jobs-description-content__text",
-                        "div.jobs-description",
-                        "article.jobs-description",
-                        ".description__text",
-                        ".description",
-                    ]
-
-                    for sel in t_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                text = loc.first.inner_text().strip()
-                                if text:  # Only accept non-empty text
-                                    title = text
-                                    print(f"✓ Title found with selector: {sel[:50]}")
-                                    break
-                        except Exception:
-                            continue
-                    
-                    if title == "Unknown":
-                        print("⚠️ Could not extract job title - will try all selectors on next run")
+        today_count = logger.get_today_count()
+        cap_reached = False
+
+        pool = TabPool([getattr(bot, "page", None)])
+        if hasattr(bot, "new_page"):
+            await pool.grow(bot.new_page, min(APPLY_CONCURRENCY, len(jobs)), label="apply tab")
+
+        async def apply_job(idx: int, job: Dict[str, str]):
+            nonlocal applied_count, today_count, cap_reached
+            url = job["url"]
+            title = job["title"]
+            company = job["company"]
+
+            async with pool.page() as page:
+                # stop if the daily cap was reached while this job waited for a tab
+                if cap_reached:
+                    return
+                print("\n" + "-" * 60)
+                print(f"📍 Job {idx}/{len(jobs)}")
+                print(url)
 
-                    for sel in c_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                text = loc.first.inner_text().strip()
-                                if text:  # Only accept non-empty text
-                                    company = text
-                                    print(f"✓ Company found with selector: {sel[:50]}")
-                                    break
-                        except Exception:
-                            continue
+                selected_resume, score, confidence = job["resume"]
+                if not selected_resume:
+                    print("❌ No resume available. Skipping job.")
+                    return
 
-                    for sel in d_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                description = loc.first.inner_text().strip()
-                                break
-                        except Exception:
-                            continue
-                except Exception as e:
-                    print("⚠️ Could not load/extract page:", e)
-
-            selected_resume, score, confidence = choose_resume(llm, resumes, description, title)
-            if not selected_resume:
-                print("❌ No resume available. Skipping job.")
-                continue
-
-            resume_path = resumes.get_resume_path(selected_resume)
-            if not resume_path:
-                print(f"❌ Resume path missing for {selected_resume}. Skipping.")
-                continue
-
-            if DRY_RUN:
-                print("🧪 DRY RUN - not actually applying. Logging only.")
-                result = "DRY_RUN"
-                success = True
-            else:
-                print("📝 Applying...")
-                result = apply_with_bot(bot, url, resume_path)
-                # Check if actually succeeded (not just returned a string)
-                success = result == "Success" if isinstance(result, str) else bool(result)
+                resume_path = resumes.get_resume_path(selected_resume)
+                if not resume_path:
+                    print(f"❌ Resume path missing for {selected_resume}. Skipping.")
+                    return
+
+                if DRY_RUN:
+                    print("🧪 DRY RUN - not actually applying. Logging only.")
+                    result = "DRY_RUN"
+                    success = True
+                else:
+                    print("📝 Applying...")
+                    result = await apply_with_bot(bot, url, resume_path, page)
+                    # Check if actually succeeded (not just returned a string)
+                    success = result == "Success" if isinstance(result, str) else bool(result)
 
             # Determine status from result
             if success:
@@ -429,7 +687,7 @@ def main(max_jobs: int = 10):
             else:
                 status = "Failed"
                 
-            logger.log_application(
+            pending_rows.append(dict(
                 job_title=title,
                 company=company,
                 platform="LinkedIn",
@@ -440,21 +698,33 @@ def main(max_jobs: int = 10):
                 location=location,
                 application_url=url,
                 notes=str(result)[:1000] if result else ""
-            )
+            ))
+            today_count += 1
 
             if success:
                 applied_count += 1
 
             # polite pause & stop if reached daily cap
-                human_sleep(0.3, 0.6)
+                await human_sleep(0.3, 0.6)
             try:
-                today_count = logger.get_today_count()
-                if today_count >= MAX_APPLICATIONS_PER_DAY:
+                if len(pending_rows) >= _LOG_FLUSH_EVERY:
+                    logger.log_application_batch(pending_rows)
+                    pending_rows.clear()
+                    today_count = logger.get_today_count()
+                if today_count >= MAX_APPLICATIONS_PER_DAY and not cap_reached:
+                    cap_reached = True
                     print(f"\n🛑 Reached daily cap ({today_count}/{MAX_APPLICATIONS_PER_DAY}). Stopping.")
-                    break
             except Exception:
                 pass
 
+        try:
+            await asyncio.gather(*(apply_job(idx, job) for idx, job in enumerate(jobs, start=1)))
+        finally:
+            await pool.close()
+
+        logger.log_application_batch(pending_rows)
+        pending_rows.clear()
+
         print("\n" + "=" * 60)
         print(f"Session applied count: {applied_count}")
         stats = logger.get_statistics()
@@ -468,18 +738,35 @@ def main(max_jobs: int = 10):
         try:
             if bot:
                 if hasattr(bot, "close"):
-                    bot.close()
+                    await bot.close()
                 elif hasattr(bot, "stop_browser"):
-                    bot.stop_browser()
+                    await bot.stop_browser()
         except Exception:
             pass
         try:
+            if pending_rows:
+                logger.log_application_batch(pending_rows)
             logger.close()
         except Exception:
             pass
+        if cache is not None:
+            try:
+                cache.close()
+            except Exception:
+                pass
 
     print("✅ Done. Check data/job_tracker.xlsx or logs for details.")
 
 
 if __name__ == "__main__":
-    main(max_jobs=10)
\ No newline at end of file
+    # Show our helpers' DEBUG-level failure details (with tracebacks), not every library's
+    if BOT_DEBUG:
+        logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+        logging.getLogger("src").setLevel(logging.DEBUG)
+    # uvloop is optional (not available on Windows); the stock event loop works the same, just slower
+    try:
+        import uvloop
+        uvloop.install()
+    except Exception:
+        pass
+    asyncio.run(main(max_jobs=10, refresh="--refresh" in sys.argv))
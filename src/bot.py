@@ -4,13 +4,22 @@ Handles all browser automation using Playwright.
 Combines High-Stealth settings with Smart Form Filling logic.
 """
 
-from playwright.sync_api import sync_playwright, BrowserContext, Page
+from playwright.async_api import async_playwright, BrowserContext, Page, Locator
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
-from typing import Optional, Dict
-import time
+from urllib.parse import urlparse
+from typing import Optional, Dict, Iterable, List, Set, Tuple
+from datetime import datetime
+import asyncio
+import csv
+import functools
+import mimetypes
+import random
+import re
+import weakref
 
 # Import your configuration and utils
-from src.config import CHROME_USER_DATA, DRY_RUN
+from src.config import CHROME_USER_DATA, DRY_RUN, BOT_DEBUG
 from src.user_config import PROFILE, ANSWERS
 from src.utils import (
     human_sleep, 
@@ -21,32 +30,414 @@ from src.utils import (
     simulate_reading_pattern
 )
 
-class JobBot:
-    def __init__(self, headless: bool = False):
-        """
-        Initialize the bot with browser settings.
-        """
-        self.headless = headless
-        self.profile_dir = Path(CHROME_USER_DATA)
-        self.playwright = None
-        self.browser: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
-        # Create profile dir if missing
-        self.profile_dir.mkdir(parents=True, exist_ok=True)
-        print(f"🤖 Bot initialized (Headless: {headless})")
+# Same-origin job switch through LinkedIn's router
+_SPA_NAVIGATE_JS = """
+url => {
+    window.history.pushState({}, '', url);
+    window.dispatchEvent(new PopStateEvent('popstate'));
+}
+"""
+# The details pane / top card shows the target job id (titles repeat across postings, ids don't)
+_JOB_SHOWN_JS = """
+id => !!document.querySelector(
+    `.jobs-details [data-job-id="${id}"], .job-view-layout [data-job-id="${id}"], ` +
+    `.jobs-unified-top-card a[href*="/jobs/view/${id}"], ` +
+    `.job-details-jobs-unified-top-card__job-title a[href*="/jobs/view/${id}"], ` +
+    `h1 a[href*="/jobs/view/${id}"]`
+)
+"""
+_JOB_ID_RE = re.compile(r"/jobs/view/(\d+)|[?&]currentJobId=(\d+)")
+
+# Resources blocked on every tab of the context
+HEAVY_RESOURCE_GLOB = "**/*.{png,jpg,jpeg,gif,woff,woff2,mp4,webm}"
+# Analytics / tracking endpoints - none of them take part in the apply flow
+TRACKER_URL_RE = re.compile(
+    r"(doubleclick|googletagmanager|google-analytics|px\.ads\.linkedin|linkedin\.com/li/track"
+    r"|hotjar|segment\.(io|com)|mixpanel)"
+)
+
+
+async def _abort_route(route):
+    await route.abort()
+
+
+# Unfilled form questions: appended to a CSV while running, styled Excel copy built on close
+UNFILLED_CSV = Path("data/unfilled_fields_tracker.csv")
+UNFILLED_XLSX = Path("data/unfilled_fields_tracker.xlsx")
+UNFILLED_COLUMNS = ["Date", "Question/Field", "Suggested Answer", "Job URL"]
+
+# Easy Apply buttons, modal containers and step buttons - each list is matched with one compound selector
+APPLY_BUTTON_SELECTOR = ", ".join([
+    "button.jobs-apply-button",
+    "button[aria-label*='Easy Apply to']",  # Includes job title - more specific
+    "button[data-control-name*='jobdetails_topcard_inapply']",
+    "a[aria-label*='Easy Apply to'][data-view-name='job-apply-button']",
+    "button[aria-label*='Easy Apply']",
+    "a[aria-label*='Easy Apply']",
+])
+MODAL_SELECTOR = ".jobs-easy-apply-content, div[role='dialog'], .jobs-easy-apply-modal"
+
+# Share of jobs that get the mouse "reading" pass over the title before applying.
+# Sampling keeps the stealth signal without paying several seconds on every job.
+READING_SIMULATION_RATE = 0.33
+# Step buttons: CSS selectors plus a (case-insensitive) text fallback, matched in the page
+NEXT_BUTTON_CSS = [
+    "button[aria-label='Continue to next step']",
+    "button[data-easy-apply-next-button]",
+    "button[aria-label='Next']",
+]
+REVIEW_BUTTON_CSS = [
+    "button[data-live-test-easy-apply-review-button]",
+    "button[aria-label='Review your application']",
+    "button[aria-label='Review']",
+]
+_STEP_BUTTONS = {"next": NEXT_BUTTON_CSS, "review": REVIEW_BUTTON_CSS}
+# Debug dump: [index, label] of the visible buttons among the first 10, in one round-trip
+_VISIBLE_BUTTON_LABELS_JS = """
+els => els.slice(0, 10)
+    .map((e, i) => [i, e.getAttribute('aria-label') || (e.innerText || '').slice(0, 30) || 'no-label', e.offsetParent !== null])
+    .filter(([, , visible]) => visible)
+    .map(([i, label]) => [i, label])
+"""
+# Any button that lets a form step progress (used to wait for the step to be ready)
+STEP_READY_SELECTOR = ", ".join(["button[aria-label='Submit application']"] + NEXT_BUTTON_CSS + REVIEW_BUTTON_CSS)
+FORM_ERROR_SELECTOR = ".artdeco-inline-feedback__message"
+POST_APPLY_SELECTOR = "[data-test-modal-id='post-apply-modal'], [aria-labelledby='post-apply-modal']"
+
+# Waits (in the page, one round-trip) until the form reaches a state we can act on:
+# 'ready' (a step button is shown - by selector, or a visible Next/Review/Submit text button),
+# 'sent' (LinkedIn's "application sent" dialog) or 'error' (validation message, no button).
+# A MutationObserver re-checks on DOM changes; false if nothing shows up within `timeout` ms.
+_STEP_STATE_JS = """
+({ ready, sent, error, timeout }) => {
+    const textButton = () => {
+        const modal = document.querySelector('.jobs-easy-apply-content');
+        return !!modal && Array.from(modal.querySelectorAll('button')).some(b =>
+            b.offsetParent !== null && /\\b(next|review|submit)\\b/i.test(b.textContent || ''));
+    };
+    const state = () => {
+        if (document.querySelector(sent)) return 'sent';
+        if (document.querySelector(ready) || textButton()) return 'ready';
+        if (document.querySelector(error)) return 'error';
+        return false;
+    };
+    const now = state();
+    if (now) return now;
+    return new Promise(resolve => {
+        let timer;
+        const finish = value => { observer.disconnect(); clearTimeout(timer); resolve(value); };
+        const observer = new MutationObserver(() => { const value = state(); if (value) finish(value); });
+        observer.observe(document.body, {
+            subtree: true, childList: true, attributes: true, attributeFilter: ['class', 'style', 'hidden'],
+        });
+        timer = setTimeout(() => finish(false), timeout);
+    });
+}
+"""
+_STEP_STATE_ARGS = {
+    "ready": STEP_READY_SELECTOR,
+    "sent": POST_APPLY_SELECTOR,
+    "error": FORM_ERROR_SELECTOR,
+    "timeout": 2000,
+}
+
+# One round-trip per form step: report a visible Submit button, or click Next / Review
+# and wait for the next step to render (clicked button detaches or the step
+# progress/header changes, max 2s).
+_ADVANCE_STEP_JS = """
+async ({ next, review }) => {
+    const root = document.querySelector('.jobs-easy-apply-content') || document;
+    const visible = el => !!el && el.offsetParent !== null;
+    if (visible(root.querySelector("button[aria-label='Submit application']"))) return 'submit';
+
+    const buttons = Array.from(root.querySelectorAll('button')).filter(visible);
+    const pick = (css, text) => buttons.find(b =>
+        css.some(sel => b.matches(sel)) || (b.textContent || '').toLowerCase().includes(text));
+    const nextButton = pick(next, 'next');
+    const target = nextButton || pick(review, 'review');
+    if (!target) return 'stuck';
+
+    // Which step is showing: progress value + step header (null once the modal is gone)
+    const stepKey = () => {
+        const modal = document.querySelector('.jobs-easy-apply-content');
+        if (!modal) return null;
+        const bar = modal.querySelector('progress, [role="progressbar"]');
+        const header = modal.querySelector('h3');
+        return (bar ? bar.getAttribute('value') || bar.getAttribute('aria-valuenow') || '' : '') +
+            '|' + (header ? header.textContent.trim() : '');
+    };
+    const before = stepKey();
+
+    target.scrollIntoView({ block: 'center' });
+    target.click();
+    await new Promise(resolve => {
+        // Step buttons are on the page before the click too, so "a button exists" says nothing;
+        // the step has moved on once the button we clicked is gone or the progress/header
+        // changed (React may keep the same footer button node across steps)
+        const done = () => !target.isConnected || stepKey() !== before;
+        let timer;
+        const finish = () => { observer.disconnect(); clearTimeout(timer); resolve(); };
+        const observer = new MutationObserver(() => { if (done()) finish(); });
+        observer.observe(document.body, {
+            subtree: true, childList: true, characterData: true,
+            attributes: true, attributeFilter: ['value', 'aria-valuenow'],
+        });
+        timer = setTimeout(finish, 2000);
+        if (done()) finish();
+    });
+    return nextButton ? 'next' : 'review';
+}
+"""
+
+# Common dropdown answers (keyword in label -> option to pick)
+DROPDOWN_ANSWERS = {
+    "english": "Professional working proficiency",
+    "proficiency": "Professional working proficiency",
+    "degree": "No",
+    "bachelor": "No",
+    "master": "No",
+    "education": "No",
+    "time zone": "No",
+    "us time": "No",
+    "experience": "2",
+    "years": "2",
+}
+
+
+def _compile_keywords(keywords: Iterable[str]) -> Optional[Tuple["re.Pattern", Dict[str, List[str]]]]:
+    """
+    Build a single-pass matcher for a fixed set of substrings.
+
+    The lookahead alternation (longest first) reports the longest keyword starting
+    at each position; shorter keywords at the same position are its prefixes, so
+    they are added from a precomputed table. The result equals `k in text` for every k.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    if not ordered:
+        return None
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    prefixes = {k: [p for p in ordered if k.startswith(p)] for k in ordered}
+    return pattern, prefixes
+
+
+def _keywords_in(text: str, matcher) -> Set[str]:
+    """Return every keyword of a _compile_keywords() matcher that occurs in text."""
+    found = set()
+    if matcher is not None:
+        pattern, prefixes = matcher
+        for m in pattern.finditer(text):
+            found.update(prefixes[m.group(1)])
+    return found
+
+
+# PROFILE / ANSWERS / DROPDOWN_ANSWERS are fixed for the run - preprocess them once.
+# A PROFILE key matches a label when any of its words does; the earliest key wins.
+# Rules are [key, words, value] in dict order, matched inside the page (see _FILL_STEP_JS).
+_PROFILE_RULES = [
+    [key, key.lower().replace("_", " ").split(), str(value)] for key, value in PROFILE.items()
+]
+
+# ANSWERS are matched against lowercased fieldset text, so questions are lowercased once;
+# pairs keep the dict order
+_ANSWER_PAIRS = [[question.lower(), str(answer)] for question, answer in ANSWERS.items()]
+
+_DROPDOWN_RANK = {k: i for i, k in enumerate(DROPDOWN_ANSWERS)}
+_DROPDOWN_MATCHER = _compile_keywords(DROPDOWN_ANSWERS)
+
+# pandas / openpyxl are only needed to build the Excel tracker - imported on first use
+_pd = _openpyxl = _Font = _PatternFill = _Alignment = None
+
+
+def _ensure_excel():
+    """Import the Excel stack once and bind it at module level."""
+    global _pd, _openpyxl, _Font, _PatternFill, _Alignment
+    if _pd is None:
+        import pandas as pd
+        import openpyxl
+        from openpyxl.styles import Font, PatternFill, Alignment
+        _pd, _openpyxl = pd, openpyxl
+        _Font, _PatternFill, _Alignment = Font, PatternFill, Alignment
+
+
+# Form templates repeat across jobs, so suggestions for a given question are memoized
+@functools.lru_cache(maxsize=1024)
+def _suggest_answer(field_lower: str) -> str:
+    """Suggest what to add to user_config based on a (lowercased) field name."""
+    # Salary/CTC questions
+    if any(word in field_lower for word in ["ctc", "salary", "compensation", "expected"]):
+        if "current" in field_lower:
+            return 'Add to PROFILE: "current ctc": "0"'
+        else:
+            return 'Add to PROFILE: "expected ctc": "18"'
+    
+    # Experience questions
+    elif any(word in field_lower for word in ["experience", "years"]):
+        tech = None
+        if "python" in field_lower:
+            tech = "python"
+        elif "java" in field_lower:
+            tech = "java"
+        elif "react" in field_lower:
+            tech = "react"
+        elif "node" in field_lower:
+            tech = "node"
+        elif "aws" in field_lower or "cloud" in field_lower:
+            tech = "aws"
+        
+        if tech:
+            return f'Add to PROFILE: "{tech}": "2"'
+        else:
+            return 'Add to PROFILE: "experience": "2"'
+    
+    # Notice period
+    elif "notice" in field_lower:
+        return 'Add to PROFILE: "notice": "0"'
+    
+    # Yes/No questions (radio/checkboxes)
+    elif any(word in field_lower for word in ["willing", "comfortable", "authorized", "completed"]):
+        keyword = _extract_keyword(field_lower)
+        return f'Add to ANSWERS: "{keyword}": "Yes" or "No"'
+    
+    # Dropdown selections
+    elif "select an option" in field_lower or "dropdown" in field_lower:
+        return "Check dropdown options and add to PROFILE or ANSWERS"
+    
+    else:
+        return "Review question and add appropriate value"
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_keyword(text: str) -> str:
+    """Extract key phrase from question for ANSWERS dict."""
+    # Common patterns
+    if "bachelor" in text or "degree" in text:
+        return "bachelor"
+    elif "background check" in text:
+        return "background check"
+    elif "remote" in text:
+        return "remote"
+    elif "relocate" in text:
+        return "relocate"
+    elif "time zone" in text or "us time" in text:
+        return "time zone"
+    else:
+        # Return first meaningful words
+        words = text.split()[:4]
+        return " ".join(words)
+
+
+# Form fields scanned on every Easy Apply step
+TEXT_INPUT_SELECTOR = "input[type='text'], input[type='email'], input[type='tel'], input[type='number']"
+
+# label[for] text by id, built once per evaluate (one pass over the labels instead of a
+# document query per field); the first label for an id wins, like querySelector
+_LABELS_BY_ID_JS = """
+    const labelsById = new Map();
+    for (const l of document.querySelectorAll('label[for]')) {
+        if (!labelsById.has(l.htmlFor)) labelsById.set(l.htmlFor, l.innerText);
+    }
+"""
+
+# <select> fields: visibility, label[for] text and the option texts in one round-trip
+_DESCRIBE_SELECTS_JS = """
+els => {""" + _LABELS_BY_ID_JS + """
+    return els.map(el => ({
+        visible: el.offsetParent !== null,
+        label: (el.id && labelsById.get(el.id)) || '',
+        options: Array.from(el.options).map(o => o.text),
+    }));
+}
+"""
+# One round-trip per form step: scroll the modal, fill every visible empty text input that
+# matches a PROFILE rule, and click the answer label of every fieldset matching ANSWERS.
+# Values go through the native setter + input/change events so React sees them (like fill()).
+# Radio labels mirror label:has-text() (case-insensitive substring). Returns what was done.
+_FILL_STEP_JS = """
+({ inputSelector, profile, answers }) => {
+    const visible = el => el.offsetParent !== null;
+    const modal = document.querySelector('.jobs-easy-apply-content');
+    if (modal) modal.scrollBy(0, modal.scrollHeight / 2);
+""" + _LABELS_BY_ID_JS + """
+    const setValue = (el, value) => {
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+        el.focus();
+        setter.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.blur();
+    };
+
+    const filled = [], unfilled = [], unfilledRadios = [];
+    for (const el of document.querySelectorAll(inputSelector)) {
+        if (!visible(el) || el.value) continue;
+        const wrap = el.closest('label');
+        const label = ((el.id && labelsById.get(el.id)) || (wrap && wrap.innerText) || '').trim().toLowerCase();
+        const rule = profile.find(([, words]) => words.some(w => label.includes(w)));
+        if (rule) {
+            setValue(el, rule[2]);
+            filled.push(rule[0]);
+        } else if (label) {
+            unfilled.push(label);
+        }
+    }
+
+    for (const fs of document.querySelectorAll('fieldset')) {
+        const text = (fs.textContent || '').toLowerCase();
+        const labels = Array.from(fs.querySelectorAll('label'));
+        let target = null;
+        for (const [question, answer] of answers) {
+            if (!text.includes(question)) continue;
+            const want = answer.toLowerCase();
+            target = labels.find(l =>
+                visible(l) && (l.textContent || '').replace(/\\s+/g, ' ').toLowerCase().includes(want));
+            if (target) break;
+        }
+        if (target) target.click();
+        else if (text.trim()) unfilledRadios.push(text.slice(0, 100));
+    }
+    return { filled, unfilled, unfilledRadios };
+}
+"""
+_FILL_STEP_ARGS = {"inputSelector": TEXT_INPUT_SELECTOR, "profile": _PROFILE_RULES, "answers": _ANSWER_PAIRS}
+
+# Fake "navigator" properties on every document. Plain JS only (no Python helpers): an error here
+# aborts the remaining definitions. A real window.chrome is kept rather than replaced.
+STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => false });
+    window.chrome = window.chrome || { runtime: {} };
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+"""
+
+# Shared browser: one Playwright driver + one persistent Chrome context per process.
+# A Chrome profile can only be open in one browser at a time, so every JobBot shares it.
+_shared_playwright = None
+_shared_context: Optional[BrowserContext] = None
+_shared_lock = asyncio.Lock()
+# Resume upload payloads by (path, mtime): shared by every bot / tab, re-read only if the file changes
+_resume_payloads: Dict[Tuple[str, int], Dict] = {}
+
+
+async def get_shared_context(headless: bool = False) -> BrowserContext:
+    """
+    Launch the browser with MAXIMUM anti-detection settings on first call,
+    and return the same context on every later call.
+    """
+    global _shared_playwright, _shared_context
+    async with _shared_lock:
+        if _shared_context is not None:
+            return _shared_context
 
-    def start_browser(self):
-        """
-        Launch the browser with MAXIMUM anti-detection settings.
-        """
         print("🚀 Launching Stealth Browser...")
-        self.playwright = sync_playwright().start()
+        profile_dir = Path(CHROME_USER_DATA)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        _shared_playwright = await async_playwright().start()
         
         # 1. Launch with specific arguments to hide automation
-        self.browser = self.playwright.chromium.launch_persistent_context(
-            user_data_dir=str(self.profile_dir),
+        context = await _shared_playwright.chromium.launch_persistent_context(
+            user_data_dir=str(profile_dir),
             channel="chrome",       # Uses your real Chrome
-            headless=self.headless,
+            headless=headless,
             viewport={'width': 1920, 'height': 1080},
             args=[
                 '--disable-blink-features=AutomationControlled', # CRITICAL: Hides "controlled by automated software"
@@ -59,65 +450,157 @@ class JobBot:
                 '--disable-features=IsolateOrigins,site-per-process',
             ]
         )
-        
-        # 2. Get the page
-        self.page = self.browser.pages[0] if self.browser.pages else self.browser.new_page()
+
+        # 2. Images, fonts and video aren't needed to read or fill a job form
+        await context.route(HEAVY_RESOURCE_GLOB, _abort_route)
+        # Matched by Playwright itself, so unrelated requests never reach Python
+        await context.route(TRACKER_URL_RE, _abort_route)
 
         # 3. Inject JavaScript to fake "navigator" properties (The Cloak)
-        self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            window.chrome = { runtime: {} };
-            human_sleep(0.7, 1.5)
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-        """)
-        
+        # Installed on the context so every tab (scraping / parallel apply) gets it
+        await context.add_init_script(STEALTH_INIT_JS)
+
+        _shared_context = context
         print("✅ Stealth Browser Ready")
+        return context
+
+
+async def close_shared_context():
+    """
+    Close the shared context and stop the Playwright driver (if launched).
+    """
+    global _shared_playwright, _shared_context
+    async with _shared_lock:
+        if _shared_context is not None:
+            try:
+                await _shared_context.close()
+            except Exception:
+                pass
+        if _shared_playwright is not None:
+            try:
+                await _shared_playwright.stop()
+            except Exception:
+                pass
+        _shared_playwright = _shared_context = None
 
-    def apply_to_job(self, job_url, resume_path):
+
+class JobBot:
+    def __init__(self, headless: bool = False, context: Optional[BrowserContext] = None):
+        """
+        Initialize the bot with browser settings.
+        
+        Args:
+            headless: Run Chrome without a window
+            context: Existing browser context to drive (default: the process-wide shared one)
+        """
+        self.headless = headless
+        self.browser: Optional[BrowserContext] = context
+        self.page: Optional[Page] = None
+        # Locators are lazy (re-query on use), so each tab's set is built once and reused
+        self._locators: "weakref.WeakKeyDictionary[Page, Dict[str, Locator]]" = weakref.WeakKeyDictionary()
+        # Unfilled-fields CSV stays open for the session (opened on first use)
+        self._unfilled_file = None
+        self._unfilled_writer = None
+        # Switch jobs through the SPA router until it fails once, then always do full loads
+        self._spa_navigation = True
+        print(f"🤖 Bot initialized (Headless: {headless})")
+
+    async def start_browser(self):
+        """
+        Attach to the browser context (launching the shared one if needed) and pick a tab.
+        """
+        if self.browser is None:
+            self.browser = await get_shared_context(self.headless)
+        
+        # Get the page
+        self.page = self.browser.pages[0] if self.browser.pages else await self.browser.new_page()
+        # Fail fast on missing elements; slow navigations pass their own timeout
+        self.page.set_default_timeout(3000)
+        self.page.set_default_navigation_timeout(20000)
+
+    async def new_page(self) -> Page:
+        """
+        Open another tab in the persistent context (shares the login session).
+        """
+        page = await self.browser.new_page()
+        page.set_default_timeout(3000)
+        page.set_default_navigation_timeout(20000)
+        return page
+
+    def _page_locators(self, page: Page) -> Dict[str, Locator]:
+        """
+        Return the reusable locators for a tab, creating them on first use.
+        """
+        locs = self._locators.get(page)
+        if locs is None:
+            locs = self._locators[page] = {
+                "apply": page.locator(f"{APPLY_BUTTON_SELECTOR} >> visible=true").first,
+                "modal": page.locator(".jobs-easy-apply-content"),
+                "submit": page.locator(
+                    ".jobs-easy-apply-content button[aria-label='Submit application'] >> visible=true"
+                ).first,
+                "buttons_in_modal": page.locator(".jobs-easy-apply-content button"),
+                "error": page.locator(FORM_ERROR_SELECTOR),
+                "selects": page.locator("select"),
+                "file_input": page.locator("input[type='file']"),
+            }
+        return locs
+
+    async def _open_job(self, page: Page, job_url: str):
+        """
+        Show a job posting in the tab.
+        Already on a LinkedIn jobs page: let the SPA router swap the job in (no app-shell reload).
+        Otherwise, or if the router doesn't render the new job in time, do a full navigation
+        (and stop trying the router for the rest of the session).
+        """
+        current, target = urlparse(page.url), urlparse(job_url)
+        match = _JOB_ID_RE.search(job_url)
+        if (self._spa_navigation and match and current.netloc
+                and current.netloc == target.netloc and "/jobs/" in current.path):
+            try:
+                await page.evaluate(_SPA_NAVIGATE_JS, job_url)
+                await page.wait_for_function(_JOB_SHOWN_JS, arg=match.group(1) or match.group(2), timeout=5000)
+                return
+            except Exception:
+                self._spa_navigation = False
+        # DOM is enough here; reading-pattern and selector waits cover the rest
+        await page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
+
+    async def apply_to_job(self, job_url, resume_path, page: Optional[Page] = None):
         """
         The main logic loop to apply for a single job.
+        
+        Args:
+            job_url: Job posting to apply to
+            resume_path: Resume file to upload
+            page: Tab to work in (defaults to the bot's main page), so several
+                  applications can run side by side in the same browser context
         """
-        if not self.page:
-            self.start_browser()
+        if page is None:
+            if not self.page:
+                await self.start_browser()
+            page = self.page
+
+        locs = self._page_locators(page)
 
         print(f"\n🔗 Navigating to: {job_url}")
         try:
-            self.page.goto(job_url, timeout=60000)
-            human_sleep(1, 2) # Let page load
-
-            # 1. Simulate Reading (Important for stealth)
-            simulate_reading_pattern(self.page, "h1")
-            # We look for multiple variations of the button
-            apply_locators = [
-                # Most specific first (single button match)
-                "button.jobs-apply-button",
-                "button[aria-label*='Easy Apply to']",  # Includes job title - more specific
-                "button[data-control-name*='jobdetails_topcard_inapply']",
-                # Link variants
-                "a[aria-label*='Easy Apply to'][data-view-name='job-apply-button']",
-                # Generic fallbacks
-                "button[aria-label*='Easy Apply']",
-                "a[aria-label*='Easy Apply']",
-            ]
-            
+            await self._open_job(page, job_url)
+            await human_sleep(1, 2) # Let page load
+
+            # 1. Simulate Reading on a sample of jobs (stealth - skipped in dry runs)
+            if not DRY_RUN and random.random() < READING_SIMULATION_RATE:
+                await simulate_reading_pattern(page, "h1")
+            # One query for every variation of the button, narrowed to the first visible match
             clicked = False
-            for selector in apply_locators:
-                try:
-                    loc = self.page.locator(selector)
-                    count = loc.count()
-                    if count > 0:
-                        # Find the first VISIBLE element
-                        for i in range(count):
-                            elem = loc.nth(i)
-                            if elem.is_visible():
-                                print(f"👇 Clicking Easy Apply... (found at index {i})")
-                                elem.click()
-                                clicked = True
-                                break
-                        if clicked:
-                            break
-                except Exception as e:
-                    continue
+            try:
+                apply_btn = locs["apply"]
+                if await apply_btn.count() > 0:
+                    print("👇 Clicking Easy Apply...")
+                    await apply_btn.click()
+                    clicked = True
+            except Exception:
+                pass
 
             if not clicked:
                 print("⚠️ No 'Easy Apply' button found (Might be external or already applied). Skipping.")
@@ -126,27 +609,20 @@ class JobBot:
             # Wait for the Easy Apply modal to appear
             print("⏳ Waiting for Easy Apply modal...")
             try:
-                # Wait for modal container to be visible
-                modal_selectors = [
-                    ".jobs-easy-apply-content",
-                    "div[role='dialog']",
-                    ".jobs-easy-apply-modal"
-                ]
+                # Wait for any of the modal containers to be visible
                 modal_found = False
-                for selector in modal_selectors:
-                    try:
-                        self.page.wait_for_selector(selector, state="visible", timeout=5000)
-                        print(f"✅ Modal loaded: {selector}")
-                        modal_found = True
-                        break
-                    except:
-                        continue
+                try:
+                    await page.wait_for_selector(MODAL_SELECTOR, state="visible")
+                    print("✅ Modal loaded")
+                    modal_found = True
+                except PlaywrightTimeoutError:
+                    pass
                 
                 if not modal_found:
                     print("⚠️ Easy Apply modal didn't load. Job might require external application.")
                     return "Skipped (No modal)"
                 
-                human_sleep(0.5, 1)
+                await human_sleep(0.5, 1)
             except Exception as e:
                 print(f"⚠️ Modal wait failed: {e}")
                 return "Skipped (Modal error)"
@@ -157,33 +633,38 @@ class JobBot:
             for step in range(max_steps):
                 print(f"   ➡️ Form Step {step + 1}")
                 
-                # Scroll within the modal to load all fields
-                try:
-                    modal = self.page.locator(".jobs-easy-apply-content")
-                    if modal.count() > 0:
-                        modal.first.evaluate("el => el.scrollBy(0, el.scrollHeight / 2)")
-                        human_sleep(0.2, 0.4)
-                except:
-                    pass
+                # Check for the modal once per step; the scroll and debug lookups reuse the result
+                modal = locs["modal"]
+                modal_exists = await modal.count() > 0
                 
-                # A. Auto-Fill inputs
-                self._fill_smart_fields()
+                # A. Scroll the modal and auto-fill inputs / radios
+                await self._fill_smart_fields(page)
                 
                 # A2. Handle dropdowns
-                self._fill_dropdowns()
+                await self._fill_dropdowns(page)
 
                 # B. Upload Resume if asked
-                self._handle_upload(resume_path)
+                await self._handle_upload(page, resume_path)
 
-                # C. Check for SUBMIT (look within modal first)
-                modal = self.page.locator(".jobs-easy-apply-content")
-                submit_btn = modal.locator("button[aria-label='Submit application']") if modal.count() > 0 else self.page.locator("button[aria-label='Submit application']")
-                if submit_btn.count() > 0 and submit_btn.is_visible():
+                # C/D. Submit if ready, otherwise click NEXT or REVIEW (all decided in the page).
+                # One browser-side wait for whichever terminal state shows up first
+                # (false after 2s: stuck forms are handled by the in-page check below).
+                phase = await page.evaluate(_STEP_STATE_JS, _STEP_STATE_ARGS)
+                if phase == "sent":
+                    print("✅ Application already sent")
+                    return "Success"
+                if phase == "error":
+                    print("❌ Form Error: Missing required field.")
+                    return "Failed (Form Error)"
+                state = await page.evaluate(_ADVANCE_STEP_JS, _STEP_BUTTONS)
+                if state == "submit":
                     print("✅ Found Submit button!")
                     if not DRY_RUN:
                         try:
-                            human_click(self.page, "button[aria-label='Submit application']")
-                            human_sleep(1, 2) # Wait for submission
+                            if not await human_click(page, locs["submit"]):
+                                print("   ❌ Submit click failed")
+                                return "Failed (Submit error: click failed)"
+                            await human_sleep(1, 2) # Wait for submission
                             print("   ✅ Submit clicked")
                         except Exception as e:
                             print("   ❌ Submit click failed:", e)
@@ -192,100 +673,34 @@ class JobBot:
                         print("   (DRY RUN: Submit skipped)")
                     return "Success"
 
-                # D. Check for NEXT or REVIEW (within modal)
-                # Get modal context first
-                modal = self.page.locator(".jobs-easy-apply-content")
-                search_context = modal if modal.count() > 0 else self.page
-                
-                # Try multiple Next button selectors
-                next_selectors = [
-                    "button[aria-label='Continue to next step']",
-                    "button[data-easy-apply-next-button]",
-                    "button:has-text('Next')",
-                    "button[aria-label='Next']",
-                ]
-                review_selectors = [
-                    "button[data-live-test-easy-apply-review-button]",
-                    "button[aria-label='Review your application']",
-                    "button[aria-label='Review']",
-                    "button:has-text('Review')",
-                ]
-
-                next_clicked = False
-                for selector in next_selectors:
-                    try:
-                        loc = search_context.locator(selector)
-                        if loc.count() > 0 and loc.first.is_visible():
-                            try:
-                                # Wait for button to be clickable and click it
-                                loc.first.scroll_into_view_if_needed()
-                                human_sleep(0.2, 0.4)
-                                loc.first.click(timeout=5000)
-                                print("➡️ Clicked Next")
-                                next_clicked = True
-                                # Wait for page transition
-                                human_sleep(0.8, 1.5)
-                                break
-                            except Exception as click_err:
-                                # If click fails, try next selector
-                                continue
-                    except Exception:
-                        continue
-
-                if next_clicked:
-                    pass  # Already clicked, continue to next iteration
+                if state == "next":
+                    print("➡️ Clicked Next")
+                elif state == "review":
+                    print("👀 Clicked Review")
                 else:
-                    # Try Review button
-                    review_clicked = False
-                    for selector in review_selectors:
-                        try:
-                            loc = search_context.locator(selector)
-                            if loc.count() > 0 and loc.first.is_visible():
-                                try:
-                                    # Scroll button into view first
-                                    loc.first.scroll_into_view_if_needed()
-                                    human_sleep(0.2, 0.4)
-                                    loc.first.click(timeout=5000)
-                                    print("👀 Clicked Review")
-                                    review_clicked = True
-                                    # Wait for page transition
-                                    human_sleep(0.8, 1.5)
-                                    break
-                                except Exception as click_err:
-                                    continue
-                        except Exception as e:
-                            continue
+                    # Check for errors
+                    if await locs["error"].count() > 0:
+                        print("❌ Form Error: Missing required field.")
+                        return "Failed (Form Error)"
                     
-                    if not review_clicked:
-                        # Check for errors
-                        if self.page.locator(".artdeco-inline-feedback__message").count() > 0:
-                            print("❌ Form Error: Missing required field.")
-                            return "Failed (Form Error)"
-                        
-                        # Debug: show what buttons are visible IN THE MODAL
-                        print("⚠️ Stuck: No Next/Submit/Review button found.")
+                    print("⚠️ Stuck: No Next/Submit/Review button found.")
+                    # Debug: show what buttons are visible IN THE MODAL (costly, opt-in)
+                    if BOT_DEBUG:
                         print("   🔍 Debugging - checking buttons in modal:")
                         try:
-                            modal_buttons = search_context.locator("button").all()
-                            for i, btn in enumerate(modal_buttons[:10]):
-                                try:
-                                    if btn.is_visible():
-                                        label = btn.get_attribute("aria-label") or btn.inner_text()[:30] or "no-label"
-                                        print(f"      {i+1}. {label[:60]}")
-                                except:
-                                    pass
+                            buttons = locs["buttons_in_modal"] if modal_exists else page.locator("button")
+                            for i, label in await buttons.evaluate_all(_VISIBLE_BUTTON_LABELS_JS):
+                                print(f"      {i+1}. {label[:60]}")
                         except:
                             pass
-                        return "Failed (Stuck)"
-                
-                human_sleep(0.3, 0.6)
+                    return "Failed (Stuck)"
 
             return "Failed (Too many steps)"
         except Exception as e:
             print(f"❌ Error applying: {e}")
             return f"Failed: {str(e)}"
 
-    def _fill_smart_fields(self):
+    async def _fill_smart_fields(self, page: Page):
         """
         Scans the page for inputs and fills them using USER_CONFIG.
         Tracks unfilled fields for later review.
@@ -293,175 +708,125 @@ class JobBot:
         unfilled_fields = []
         
         try:
-            # 1. Text Inputs
-            inputs = self.page.locator("input[type='text'], input[type='email'], input[type='tel'], input[type='number']")
-            count = inputs.count()
-            
-            for i in range(count):
-                field = inputs.nth(i)
-                if field.is_visible() and not field.get_attribute("value"):
-                    label = self._get_label(field).lower()
-                    
-                    # Match logic - try both directions
-                    matched = False
-                    for key, value in PROFILE.items():
-                        # Check if key is in label OR label contains key words
-                        key_lower = key.lower().replace("_", " ")
-                        if key_lower in label or any(word in label for word in key_lower.split()):
-                            print(f"      ✍️ Filling {key}...")
-                            field.fill(str(value))
-                            human_sleep(0.2, 0.4)
-                            matched = True
-                            break
-                    
-                    if not matched and label:
-                        unfilled_fields.append(label)
-                        print(f"      ⚠️ Skipped unfilled field: {label}")
-
-            # 2. Radio Buttons (Yes/No)
-            fieldsets = self.page.locator("fieldset")
-            for i in range(fieldsets.count()):
-                group = fieldsets.nth(i)
-                text = group.text_content().lower()
-                
-                matched = False
-                for question, answer in ANSWERS.items():
-                    if question in text:
-                        # Try to click the specific radio (label containing 'Yes' or 'No')
-                        option = group.locator(f"label:has-text('{answer}')")
-                        if option.is_visible():
-                            option.click()
-                            human_sleep(0.2, 0.4)
-                            matched = True
-                            break
-                
-                if not matched and text.strip():
-                    unfilled_fields.append(f"Radio: {text[:100]}")
-                    print(f"      ⚠️ Skipped unfilled radio: {text[:100]}")
+            # Scroll, text inputs (PROFILE) and radio buttons (ANSWERS) in one evaluate
+            result = await page.evaluate(_FILL_STEP_JS, _FILL_STEP_ARGS)
+            for key in result["filled"]:
+                print(f"      ✍️ Filled {key}")
+            for label in result["unfilled"]:
+                unfilled_fields.append(label)
+                print(f"      ⚠️ Skipped unfilled field: {label}")
+            for text in result["unfilledRadios"]:
+                unfilled_fields.append(f"Radio: {text}")
+                print(f"      ⚠️ Skipped unfilled radio: {text}")
         
         except Exception as e:
             print(f"⚠️ Fill fields error: {e}")
         
         # Log unfilled fields
         if unfilled_fields:
-            self._log_unfilled_fields(unfilled_fields)
+            self._log_unfilled_fields(unfilled_fields, page.url)
     
-    def _fill_dropdowns(self):
+    async def _fill_dropdowns(self, page: Page):
         """Handle dropdown/select fields."""
         try:
-            # Common dropdown answers
-            dropdown_answers = {
-                "english": "Professional working proficiency",
-                "proficiency": "Professional working proficiency",
-                "degree": "No",
-                "bachelor": "No",
-                "master": "No",
-                "education": "No",
-                "time zone": "No",
-                "us time": "No",
-                "experience": "2",
-                "years": "2",
-            }
-            
-            selects = self.page.locator("select")
-            for i in range(selects.count()):
-                select = selects.nth(i)
-                if select.is_visible():
-                    # Get associated label
-                    select_id = select.get_attribute("id")
-                    label_text = ""
-                    if select_id:
-                        try:
-                            label = self.page.locator(f"label[for='{select_id}']")
-                            if label.count() > 0:
-                                label_text = label.inner_text().lower()
-                        except:
-                            pass
+            selects = self._page_locators(page)["selects"]
+            descriptions = await selects.evaluate_all(_DESCRIBE_SELECTS_JS)
+            for i, info in enumerate(descriptions):
+                if info["visible"]:
+                    select = selects.nth(i)
+                    label_text = info["label"].lower()
                     
                     # Try to match and select
-                    for keyword, value in dropdown_answers.items():
-                        if keyword in label_text:
+                    for keyword in sorted(_keywords_in(label_text, _DROPDOWN_MATCHER), key=_DROPDOWN_RANK.get):
+                        value = DROPDOWN_ANSWERS[keyword]
+                        # Decide from the option texts we already have: a label that isn't there
+                        # would make select_option() wait out the timeout and raise
+                        options = [opt.strip() for opt in info["options"]]
+                        if value in options:
                             try:
-                                select.select_option(label=value)
+                                await select.select_option(label=value)
                                 print(f"      📋 Selected dropdown: {value} for {label_text[:40]}")
-                                human_sleep(0.2, 0.4)
+                                await human_sleep(0.05, 0.15)
                                 break
-                            except:
-                                # Try selecting by value/index if label doesn't work
-                                try:
-                                    options = select.locator("option").all()
-                                    for opt in options:
-                                        if value.lower() in opt.inner_text().lower():
-                                            opt.click()
-                                            print(f"      📋 Selected dropdown: {opt.inner_text()}")
-                                            break
-                                except:
-                                    pass
+                            except Exception:
+                                pass
+                        # Label didn't match exactly - pick the first option containing the value
+                        try:
+                            for j, opt_text in enumerate(info["options"]):
+                                if value.lower() in opt_text.lower():
+                                    await select.select_option(index=j)
+                                    print(f"      📋 Selected dropdown: {opt_text}")
+                                    break
+                        except Exception:
+                            pass
         except Exception as e:
             print(f"⚠️ Dropdown fill error: {e}")
     
-    def _log_unfilled_fields(self, fields: list):
-        """Log unfilled fields to a clean, actionable Excel tracker."""
-        import pandas as pd
-        from pathlib import Path
-        from datetime import datetime
-        import openpyxl
-        from openpyxl.styles import Font, PatternFill, Alignment
-        
+    def _log_unfilled_fields(self, fields: list, job_url: str):
+        """Append unfilled fields to the CSV tracker (the styled Excel copy is built in finalize())."""
         try:
-            error_file = Path("data/unfilled_fields_tracker.xlsx")
-            
-            # Clean up field names for better readability
-            cleaned_fields = []
-            for field in fields:
-                # Remove "Radio: " prefix and clean up text
-                clean = field.replace("Radio: ", "").strip()
-                # Skip duplicates and empty
-                if clean and clean not in cleaned_fields:
-                    cleaned_fields.append(clean)
+            # Remove "Radio: " prefix, skip empties and duplicates (dict keeps first-seen order)
+            cleaned_fields = list(dict.fromkeys(
+                clean for clean in (field.replace("Radio: ", "").strip() for field in fields) if clean
+            ))
             
             if not cleaned_fields:
                 return
             
-            # Prepare clean data
-            now = datetime.now()
-            job_url = self.page.url
+            # One timestamp string for the whole batch
+            now = datetime.now().strftime("%Y-%m-%d %H:%M")
             
-            # Group by job URL to avoid duplicates
-            new_entries = []
-            for field in cleaned_fields:
-                new_entries.append({
-                    "Date": now.strftime("%Y-%m-%d %H:%M"),
-                    "Question/Field": field,
-                    "Suggested Answer": self._suggest_answer(field),
-                    "Job URL": job_url
-                })
+            # Appending is O(1); rewriting the workbook on every job was O(total rows)
+            if self._unfilled_writer is None:
+                UNFILLED_CSV.parent.mkdir(parents=True, exist_ok=True)
+                new_file = not UNFILLED_CSV.exists()
+                self._unfilled_file = open(UNFILLED_CSV, "a", newline="", encoding="utf-8")
+                self._unfilled_writer = csv.writer(self._unfilled_file)
+                if new_file:
+                    self._unfilled_writer.writerow(UNFILLED_COLUMNS)
+            self._unfilled_writer.writerows(
+                (now, field, _suggest_answer(field.lower()), job_url) for field in cleaned_fields
+            )
+            # Flush so the rows survive a crash before close()
+            self._unfilled_file.flush()
+            print(f"      📊 Logged {len(cleaned_fields)} unfilled fields to {UNFILLED_CSV}")
+        except Exception as e:
+            print(f"      ⚠️ Could not log unfilled fields: {e}")
+    
+    def finalize(self):
+        """Build the styled unfilled-fields Excel tracker once from the CSV log."""
+        if self._unfilled_file is not None:
+            self._unfilled_file.close()
+            self._unfilled_file = self._unfilled_writer = None
+        if not UNFILLED_CSV.exists():
+            return
+        try:
+            _ensure_excel()
+            pd = _pd
             
-            # Load existing or create new
-            if error_file.exists():
-                existing_df = pd.read_excel(error_file)
-                # Remove duplicates from same job
-                existing_df = existing_df[existing_df["Job URL"] != job_url]
-                df = pd.concat([existing_df, pd.DataFrame(new_entries)], ignore_index=True)
-            else:
-                df = pd.DataFrame(new_entries)
+            df = pd.read_csv(UNFILLED_CSV)
+            # Keep entries from earlier trackers that predate the CSV log
+            if UNFILLED_XLSX.exists():
+                df = pd.concat([pd.read_excel(UNFILLED_XLSX), df], ignore_index=True)
+            # One row per question per job (latest wins)
+            df = df.drop_duplicates(subset=["Job URL", "Question/Field"], keep="last")
             
             # Save to Excel with formatting
-            df.to_excel(error_file, index=False)
+            df.to_excel(UNFILLED_XLSX, index=False)
             
             # Apply formatting
-            wb = openpyxl.load_workbook(error_file)
+            wb = _openpyxl.load_workbook(UNFILLED_XLSX)
             ws = wb.active
             
             # Header formatting
-            header_font = Font(bold=True, size=12, color="FFFFFF")
-            header_fill = PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
+            header_font = _Font(bold=True, size=12, color="FFFFFF")
+            header_fill = _PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
             
             for col_num in range(1, 5):
                 cell = ws.cell(row=1, column=col_num)
                 cell.font = header_font
                 cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+                cell.alignment = _Alignment(horizontal='center', vertical='center')
             
             # Column widths
             ws.column_dimensions['A'].width = 18  # Date
@@ -472,119 +837,46 @@ class JobBot:
             # Freeze header
             ws.freeze_panes = 'A2'
             
-            wb.save(error_file)
-            print(f"      📊 Logged {len(cleaned_fields)} unfilled fields to {error_file}")
+            wb.save(UNFILLED_XLSX)
+            print(f"📊 Unfilled fields tracker updated: {UNFILLED_XLSX}")
         except Exception as e:
-            print(f"      ⚠️ Could not log unfilled fields: {e}")
-    
-    def _suggest_answer(self, field: str) -> str:
-        """Suggest what to add to user_config based on field name."""
-        field_lower = field.lower()
-        
-        # Salary/CTC questions
-        if any(word in field_lower for word in ["ctc", "salary", "compensation", "expected"]):
-            if "current" in field_lower:
-                return 'Add to PROFILE: "current ctc": "0"'
-            else:
-                return 'Add to PROFILE: "expected ctc": "18"'
-        
-        # Experience questions
-        elif any(word in field_lower for word in ["experience", "years"]):
-            tech = None
-            if "python" in field_lower:
-                tech = "python"
-            elif "java" in field_lower:
-                tech = "java"
-            elif "react" in field_lower:
-                tech = "react"
-            elif "node" in field_lower:
-                tech = "node"
-            elif "aws" in field_lower or "cloud" in field_lower:
-                tech = "aws"
-            
-            if tech:
-                return f'Add to PROFILE: "{tech}": "2"'
-            else:
-                return 'Add to PROFILE: "experience": "2"'
-        
-        # Notice period
-        elif "notice" in field_lower:
-            return 'Add to PROFILE: "notice": "0"'
-        
-        # Yes/No questions (radio/checkboxes)
-        elif any(word in field_lower for word in ["willing", "comfortable", "authorized", "completed"]):
-            keyword = self._extract_keyword(field_lower)
-            return f'Add to ANSWERS: "{keyword}": "Yes" or "No"'
-        
-        # Dropdown selections
-        elif "select an option" in field_lower or "dropdown" in field_lower:
-            return "Check dropdown options and add to PROFILE or ANSWERS"
-        
-        else:
-            return "Review question and add appropriate value"
+            print(f"⚠️ Could not build unfilled fields tracker: {e}")
     
-    def _extract_keyword(self, text: str) -> str:
-        """Extract key phrase from question for ANSWERS dict."""
-        # Common patterns
-        if "bachelor" in text or "degree" in text:
-            return "bachelor"
-        elif "background check" in text:
-            return "background check"
-        elif "remote" in text:
-            return "remote"
-        elif "relocate" in text:
-            return "relocate"
-        elif "time zone" in text or "us time" in text:
-            return "time zone"
-        else:
-            # Return first meaningful words
-            words = text.split()[:4]
-            return " ".join(words)
+    def _resume_payload(self, resume_path) -> Dict:
+        """Return the upload payload for a resume, reading the file only the first time."""
+        path = Path(resume_path)
+        key = (str(path), path.stat().st_mtime_ns)
+        payload = _resume_payloads.get(key)
+        if payload is None:
+            payload = _resume_payloads[key] = {
+                "name": path.name,
+                "mimeType": mimetypes.guess_type(path.name)[0] or "application/pdf",
+                "buffer": path.read_bytes(),
+            }
+        return payload
 
-    def _get_label(self, element):
-        """Helper to get label text for an input."""
-        try:
-            id_val = element.get_attribute("id")
-            if id_val:
-                return self.page.locator(f"label[for='{id_val}']").inner_text()
-        except:
-            return ""
-        return ""
-
-    def _handle_upload(self, resume_path):
+    async def _handle_upload(self, page: Page, resume_path):
         """Finds file inputs and uploads resume - ALWAYS replaces LinkedIn's stored resume."""
         try:
-            file_input = self.page.locator("input[type='file']")
-            if file_input.count() > 0:
+            file_input = self._page_locators(page)["file_input"]
+            if await file_input.count() > 0:
                 # ALWAYS upload our resume, even if LinkedIn has one pre-filled
                 print(f"      📎 Uploading resume: {resume_path}")
-                file_input.first.set_input_files(resume_path)
-                human_sleep(0.5, 1)
+                await file_input.first.set_input_files(files=self._resume_payload(resume_path))
+                await human_sleep(0.5, 1)
                 print(f"      ✅ Resume uploaded successfully")
         except Exception as e:
             print(f"      ⚠️ Resume upload skipped: {e}")
 
-    def close(self):
-        try:
-            # close persistent context / browser
-            if getattr(self, 'browser', None):
-                try:
-                    self.browser.close()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if getattr(self, 'playwright', None):
-                try:
-                    self.playwright.stop()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    async def close(self):
+        self.finalize()
+        # The context belongs to whoever launched it; the shared one is closed here
+        if self.browser is not None and self.browser is _shared_context:
+            await close_shared_context()
+        self.browser = self.page = None
 
 # TEST
 if __name__ == "__main__":
     bot = JobBot(headless=False)
-    bot.start_browser()
+    asyncio.run(bot.start_browser())
     # bot.apply_to_job("https://linkedin.com/jobs/view/...", "data/resumes/frontend.pdf")
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+🗃️ JOB CACHE
+Persists expensive per-job work across runs in a small SQLite file:
+- Scraped job details (title, company, description) keyed by URL
+- LLM resume selections keyed by a hash of the job description
+"""
+
+import sqlite3
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class JobCache:
+    def __init__(self, db_path: str = "data/job_cache.db", ttl_seconds: int = 86400):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite file
+            ttl_seconds: How long scraped job details stay fresh
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        # Resume matching runs on worker threads, so share one connection behind a lock
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "url TEXT PRIMARY KEY, fetched_at INTEGER, "
+            "title TEXT, company TEXT, description TEXT)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS resume_cache ("
+            "desc_sha1 TEXT PRIMARY KEY, selected TEXT, score INT, confidence REAL)"
+        )
+        self.conn.commit()
+
+
+    @staticmethod
+    def description_key(text: str) -> str:
+        """
+        Stable cache key for a job description.
+        """
+        return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+    def get_job(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Return cached job details if they were fetched within the TTL.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT title, company, description FROM jobs WHERE url = ? AND fetched_at > ?",
+                (url, int(time.time()) - self.ttl_seconds),
+            ).fetchone()
+        if not row:
+            return None
+        return {"url": url, "title": row[0], "company": row[1], "description": row[2]}
+
+
+    def put_job(self, job: Dict[str, str]):
+        """
+        Store (or refresh) the extracted details for a job URL.
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO jobs (url, fetched_at, title, company, description) VALUES (?, ?, ?, ?, ?)",
+                (job["url"], int(time.time()), job["title"], job["company"], job["description"]),
+            )
+            self.conn.commit()
+
+
+    def get_resume_choice(self, text: str) -> Optional[Tuple[str, int, float]]:
+        """
+        Return a previously computed (selected, score, confidence) for this description.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT selected, score, confidence FROM resume_cache WHERE desc_sha1 = ?",
+                (self.description_key(text),),
+            ).fetchone()
+        return (row[0], row[1], row[2]) if row else None
+
+
+    def put_resume_choice(self, text: str, selected: str, score: int, confidence: float):
+        """
+        Remember the LLM's resume selection for this description.
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resume_cache (desc_sha1, selected, score, confidence) VALUES (?, ?, ?, ?)",
+                (self.description_key(text), selected, score, confidence),
+            )
+            self.conn.commit()
+
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self.conn.close()
@@ -1,10 +1,13 @@
 #we use dynamic paths. This file calculates where your data folder is, no matter where you put the project.
 
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
-# 1. Load environment variables from .env
-load_dotenv()
+# 1. Load environment variables from .env (once: child processes inherit the loaded env)
+if not os.getenv("CONFIG_LOADED"):
+    load_dotenv()
+    os.environ["CONFIG_LOADED"] = "1"
 
 # 2. Fetch API Keys (Safety Check)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -15,30 +18,51 @@ if not GEMINI_API_KEY:
     print("⚠️ WARNING: Add gemini api key")
 
 # 3. Dynamic Path Calculation
-SRC_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.dirname(SRC_DIR)
+SRC_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SRC_DIR.parent
 
 # 4. Define Critical Data Paths
-DATA_DIR = os.path.join(ROOT_DIR, "data")
-RESUMES_DIR = os.path.join(DATA_DIR, "resumes")
-CHROME_USER_DATA = os.path.join(DATA_DIR, "chrome_profile")
-LOGS_DIR = os.path.join(DATA_DIR, "logs")
-HISTORY_FILE = os.path.join(DATA_DIR, "history.json")
+DATA_DIR = ROOT_DIR / "data"
+RESUMES_DIR = DATA_DIR / "resumes"
+CHROME_USER_DATA = DATA_DIR / "chrome_profile"
+LOGS_DIR = DATA_DIR / "logs"
+HISTORY_FILE = DATA_DIR / "history.json"
 
-# 5. Auto-Create Folders
-os.makedirs(RESUMES_DIR, exist_ok=True)
-os.makedirs(LOGS_DIR, exist_ok=True)
+# 5. Folders are created lazily, right before something is written into them
+def _ensure_dirs(*dirs):
+    """Create the given data folders (default: resumes + logs) if they don't exist yet."""
+    for folder in dirs or (RESUMES_DIR, LOGS_DIR):
+        folder.mkdir(parents=True, exist_ok=True)
 
 # 6. Runtime flags (can be overridden via environment variables)
 # DRY_RUN: when True the bot will not submit applications (safe testing)
 # HEADLESS_MODE: when False the browser will be visible for debugging
 DRY_RUN = os.getenv("DRY_RUN", "False").lower() in ("1", "true", "yes")
 HEADLESS_MODE = os.getenv("HEADLESS_MODE", "False").lower() in ("1", "true", "yes")
+# BOT_DEBUG: when True, dump the visible modal buttons when a form gets stuck
+# and log why humanised helpers (typing, clicks, scrolling) failed
+BOT_DEBUG = os.getenv("BOT_DEBUG", "False").lower() in ("1", "true", "yes")
 # Daily/application settings (can be tuned via environment)
 try:
     MAX_APPLICATIONS_PER_DAY = int(os.getenv("MAX_APPLICATIONS_PER_DAY", "40"))
 except Exception:
     MAX_APPLICATIONS_PER_DAY = 20
+# Number of job pages scraped concurrently (tabs in the shared browser context)
+try:
+    EXTRACT_CONCURRENCY = max(1, int(os.getenv("EXTRACT_CONCURRENCY", "4")))
+except Exception:
+    EXTRACT_CONCURRENCY = 4
+# Number of applications run side by side (1 = one at a time, the safest for one account)
+try:
+    APPLY_CONCURRENCY = max(1, int(os.getenv("APPLY_CONCURRENCY", "1")))
+except Exception:
+    APPLY_CONCURRENCY = 1
+# Global pace for LinkedIn page loads / scrolls while scraping (token bucket)
+try:
+    NAV_RATE_PER_SEC = float(os.getenv("NAV_RATE_PER_SEC", "1.0"))
+    NAV_BURST = int(os.getenv("NAV_BURST", "3"))
+except Exception:
+    NAV_RATE_PER_SEC, NAV_BURST = 1.0, 3
 
 # Comma-separated search queries / preferred locations
 SEARCH_QUERIES = [q.strip() for q in os.getenv("SEARCH_QUERIES", "Full Stack,Frontend Intern,Web Developer Intern,React Developer Intern,Node.js Intern").split(",") if q.strip()]
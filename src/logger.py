@@ -4,82 +4,275 @@ Tracks all applications in an Excel file with statistics and analytics.
 This is the bot's "memory" - helps you track what worked and what didn't.
 """
 
+import atexit
+import csv
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, List
 import openpyxl
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
 
+APPLICATION_HEADERS = [
+    "Date", "Job Title", "Company", "Location",
+    "Resume Used", "Status", "Application URL", "Result Details"
+]
+# Column positions in an Applications row
+COL = {'date': 0, 'title': 1, 'company': 2, 'location': 3, 'resume': 4, 'status': 5, 'url': 6, 'details': 7}
+DAILY_HEADERS = ["Date", "Applications", "Success", "Failed", "Success Rate"]
+
+# Styles are immutable in openpyxl, so build them once and share them between cells
+_HEADER_FONT = Font(bold=True, size=12, color="FFFFFF")
+_HEADER_FILL_BLUE = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_HEADER_FILL_GREEN = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+_TITLE_FONT = Font(bold=True, size=16, color="4472C4")
+_SECTION_FONT = Font(bold=True, size=12)
+_CENTER = Alignment(horizontal='center', vertical='center')
+_CENTER_H = Alignment(horizontal='center')
+_STATUS_SUCCESS_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+_STATUS_SUCCESS_FONT = Font(color="006100", bold=True)
+_STATUS_FAIL_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+_STATUS_FAIL_FONT = Font(color="9C0006", bold=True)
+_STATUS_SKIP_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+_STATUS_SKIP_FONT = Font(color="9C6500")
+
+# Status -> (result details from notes, status fill, status font); one lookup per row
+_STATUS_HANDLERS = {
+    "Success": (lambda notes: "✓ Application submitted successfully", _STATUS_SUCCESS_FILL, _STATUS_SUCCESS_FONT),
+    "Skipped": (lambda notes: f"○ Skipped - {notes}" if notes else "○ Skipped (not Easy Apply)", _STATUS_SKIP_FILL, _STATUS_SKIP_FONT),
+}
+_FAILED_HANDLER = (lambda notes: f"✗ {notes}" if notes else "✗ Application failed", _STATUS_FAIL_FILL, _STATUS_FAIL_FONT)
+_OTHER_HANDLER = (lambda notes: notes, _STATUS_SKIP_FILL, _STATUS_SKIP_FONT)
+
+
+def _status_handler(status: str):
+    """Pick the handler for a status: exact match, then any "Failed ..." status, then the rest."""
+    return _STATUS_HANDLERS.get(status) or (_FAILED_HANDLER if "Failed" in status else _OTHER_HANDLER)
+
+
 class JobLogger:
-    def __init__(self, excel_path: str = "data/job_tracker.xlsx"):
+    def __init__(self, excel_path: str = "data/job_tracker.xlsx", flush_every: int = 25):
         """
         Initialize the job application logger.
         
+        Rows are appended to a CSV sidecar (job_tracker.csv) while running; the formatted
+        Excel file is written once, in streaming (write-only) mode, on close().
+        
         Args:
             excel_path: Path to Excel file for tracking applications
+            flush_every: Flush the CSV buffer after this many rows (always flushed on close)
         """
         self.excel_path = Path(excel_path)
         self.excel_path.parent.mkdir(parents=True, exist_ok=True)
+        self.csv_path = self.excel_path.with_suffix(".csv")
+        
+        # Writes are batched in a large buffer and flushed together
+        self._pending = 0
+        self._flush_every = max(1, flush_every)
+        self._closed = False
         
-        # Load or create workbook
-        if self.excel_path.exists():
-            self.workbook = openpyxl.load_workbook(self.excel_path)
+        # (day ordinal, "YYYY-MM-DD") - the date string only changes at midnight
+        self._today_cache = (0, "")
+        
+        # Daily Summary rows by date (derived data, kept in memory until close)
+        self._daily: Dict[str, list] = {}
+        
+        if self.csv_path.exists():
+            self._load_daily_summary()
+            print(f"📊 Loaded existing tracker: {self.csv_path}")
+        elif self.excel_path.exists():
+            # Tracker from before the CSV sidecar: seed the sidecar from the workbook once
+            self._import_workbook()
             print(f"📊 Loaded existing tracker: {self.excel_path}")
         else:
-            self.workbook = Workbook()
-            self._initialize_sheets()
+            with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(APPLICATION_HEADERS)
             print(f"📊 Created new tracker: {self.excel_path}")
+        
+        self._csv_file = open(self.csv_path, "a", newline="", encoding="utf-8", buffering=1 << 20)
+        self._csv_writer = csv.writer(self._csv_file)
+        
+        # Running totals: scan the history once, then update as rows are logged
+        self._prime_counters()
+        
+        # Don't lose unsaved rows if the run ends without close()
+        atexit.register(self.close)
+    
+    
+    def _import_workbook(self):
+        """
+        Copy the Applications / Daily Summary sheets of an existing workbook into the sidecar.
+        """
+        workbook = openpyxl.load_workbook(self.excel_path, read_only=True)
+        try:
+            with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(APPLICATION_HEADERS)
+                if "Applications" in workbook.sheetnames:
+                    writer.writerows(
+                        ["" if value is None else value for value in row]
+                        for row in workbook["Applications"].iter_rows(
+                            min_row=2, max_col=len(APPLICATION_HEADERS), values_only=True
+                        )
+                    )
+            self._read_daily_sheet(workbook)
+        finally:
+            workbook.close()
+    
+    
+    def _load_daily_summary(self):
+        """
+        Read the Daily Summary rows of the last written workbook (if any).
+        """
+        if not self.excel_path.exists():
+            return
+        try:
+            workbook = openpyxl.load_workbook(self.excel_path, read_only=True)
+        except Exception as e:
+            print(f"⚠️ Could not read daily summary from {self.excel_path}: {e}")
+            return
+        try:
+            self._read_daily_sheet(workbook)
+        finally:
+            workbook.close()
+    
+    
+    def _read_daily_sheet(self, workbook):
+        """
+        Fill self._daily from a workbook's Daily Summary sheet.
+        """
+        if "Daily Summary" not in workbook.sheetnames:
+            return
+        for row in workbook["Daily Summary"].iter_rows(
+            min_row=2, max_col=len(DAILY_HEADERS), values_only=True
+        ):
+            if row and row[0]:
+                self._daily[row[0]] = list(row)
+    
+    
+    def _iter_rows(self):
+        """
+        Yield the logged application rows (header skipped), including unflushed ones.
+        """
+        if getattr(self, "_csv_file", None) is not None and not self._csv_file.closed:
+            self._csv_file.flush()
+        with open(self.csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+    
+    
+    def _today(self, now: Optional[datetime] = None) -> str:
+        """
+        Today's date as "YYYY-MM-DD", formatted once per day.
+        """
+        now = now or datetime.now()
+        day = now.toordinal()
+        cached_day, text = self._today_cache
+        if day != cached_day:
+            text = now.strftime("%Y-%m-%d")
+            self._today_cache = (day, text)
+        return text
     
     
-    def _initialize_sheets(self):
+    def _prime_counters(self):
         """
-        Create the initial structure with multiple sheets.
+        (Re)build the running counters from every logged row.
         """
-        # Remove default sheet
-        if "Sheet" in self.workbook.sheetnames:
-            self.workbook.remove(self.workbook["Sheet"])
+        self._counters = {
+            'total': 0,
+            'success': 0,
+            'failed': 0,
+            'by_platform': defaultdict(int),
+            'by_resume': defaultdict(int),
+            'today': defaultdict(int),            # day -> applications
+            'today_success': defaultdict(int),    # day -> successes
+            'today_failed': defaultdict(int),     # day -> failures
+            'today_platform': defaultdict(int),   # (day, platform) -> applications
+        }
+        for row in self._iter_rows():
+            if len(row) > COL['status']:
+                self._count_row(row)
+    
+    
+    def _count_row(self, row: list, platform: Optional[str] = None):
+        """
+        Add one Applications row to the counters.
         
-        # Create Applications sheet
-        apps_sheet = self.workbook.create_sheet("Applications", 0)
-        self._setup_applications_sheet(apps_sheet)
+        Args:
+            row: Row (list or tuple) as written to the tracker (Date, ..., Resume Used, Status, ...)
+            platform: Job board, if known (the tracker doesn't store it)
+        """
+        counters = self._counters
+        day = str(row[COL['date']])[:10]  # "YYYY-MM-DD HH:MM" -> "YYYY-MM-DD"
+        status = row[COL['status']] or ""
         
-        # Create Statistics sheet
-        stats_sheet = self.workbook.create_sheet("Statistics", 1)
-        self._setup_statistics_sheet(stats_sheet)
+        counters['total'] += 1
+        counters['today'][day] += 1
+        if status == "Success":
+            counters['success'] += 1
+            counters['today_success'][day] += 1
+        elif "Failed" in status:
+            counters['failed'] += 1
+            counters['today_failed'][day] += 1
+        
+        counters['by_resume'][row[COL['resume']]] += 1
+        if platform:
+            counters['by_platform'][platform] += 1
+            counters['today_platform'][(day, platform)] += 1
+    
+    
+    def _write_workbook(self):
+        """
+        Materialize the formatted Excel tracker from the sidecar in one streaming pass.
+        """
+        workbook = Workbook(write_only=True)
         
-        # Create Daily Summary sheet
-        daily_sheet = self.workbook.create_sheet("Daily Summary", 2)
+        apps_sheet = workbook.create_sheet("Applications")
+        self._setup_applications_sheet(apps_sheet)
+        for row in self._iter_rows():
+            # csv rows are fresh lists, so the styled status cell can be swapped in place
+            if len(row) > COL['status']:
+                # Color code status (column F)
+                status = row[COL['status']]
+                _, fill, font = _status_handler(status)
+                cell = WriteOnlyCell(apps_sheet, value=status)
+                cell.fill, cell.font = fill, font
+                row[COL['status']] = cell
+            apps_sheet.append(row)
+        
+        self._setup_statistics_sheet(workbook.create_sheet("Statistics"))
+        
+        daily_sheet = workbook.create_sheet("Daily Summary")
         self._setup_daily_summary_sheet(daily_sheet)
+        for date in sorted(self._daily):
+            daily_sheet.append(self._daily[date])
         
-        # Save initial structure
-        self.workbook.save(self.excel_path)
+        workbook.save(self.excel_path)
+    
+    
+    def _header_row(self, sheet, headers, font, fill, alignment):
+        """
+        Build a styled header row for a write-only sheet.
+        """
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.font = font
+            cell.fill = fill
+            cell.alignment = alignment
+            cells.append(cell)
+        return cells
     
     
     def _setup_applications_sheet(self, sheet):
         """
         Set up the Applications sheet with headers and formatting.
         """
-        headers = [
-            "Date", "Job Title", "Company", "Location", 
-            "Resume Used", "Status", "Application URL", "Result Details"
-        ]
-        
-        # Write headers
-        sheet.append(headers)
-        
-        # Format headers
-        header_font = Font(bold=True, size=12, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        
-        for col_num, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
         # Set column widths
         column_widths = {
             'A': 18,  # Date (with time)
@@ -97,16 +290,29 @@ class JobLogger:
         
         # Freeze header row
         sheet.freeze_panes = 'A2'
+        
+        # Write formatted headers
+        sheet.append(self._header_row(
+            sheet,
+            APPLICATION_HEADERS,
+            _HEADER_FONT,
+            _HEADER_FILL_BLUE,
+            _CENTER,
+        ))
     
     
     def _setup_statistics_sheet(self, sheet):
         """
         Set up the Statistics sheet with summary metrics.
         """
+        # Column widths
+        sheet.column_dimensions['A'].width = 25
+        sheet.column_dimensions['B'].width = 20
+        
         # Title
-        sheet['A1'] = "📊 JOB APPLICATION SUMMARY"
-        sheet['A1'].font = Font(bold=True, size=16, color="4472C4")
-        sheet.merge_cells('A1:B1')
+        title = WriteOnlyCell(sheet, value="📊 JOB APPLICATION SUMMARY")
+        title.font = _TITLE_FONT
+        sheet.append([title])
         
         # Metrics structure
         metrics = [
@@ -122,44 +328,34 @@ class JobLogger:
             # Resume stats will show which resume was most successful
         ]
         
-        for row_num, (label, formula) in enumerate(metrics, 1):
-            sheet[f'A{row_num}'] = label
-            if formula:
-                sheet[f'B{row_num}'] = formula
-        
-        # Format section headers
-        sheet['A3'].font = Font(bold=True, size=12)
-        sheet['A10'].font = Font(bold=True, size=12)
-        
-        # Format success rate as percentage
-        sheet['B8'].number_format = '0.0%'
-        
-        # Column widths
-        sheet.column_dimensions['A'].width = 25
-        sheet.column_dimensions['B'].width = 20
+        for row_num, (label, formula) in enumerate(metrics, 2):
+            label_cell = WriteOnlyCell(sheet, value=label)
+            # Format section headers
+            if row_num in (3, 10):
+                label_cell.font = _SECTION_FONT
+            value_cell = WriteOnlyCell(sheet, value=formula or None)
+            # Format success rate as percentage
+            if row_num == 8:
+                value_cell.number_format = '0.0%'
+            sheet.append([label_cell, value_cell])
     
     
     def _setup_daily_summary_sheet(self, sheet):
         """
         Set up the Daily Summary sheet for tracking daily progress.
         """
-        headers = ["Date", "Applications", "Success", "Failed", "Success Rate"]
-        
-        sheet.append(headers)
-        
-        # Format headers
-        header_font = Font(bold=True, size=12, color="FFFFFF")
-        header_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        
-        for col_num, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-        
         # Set column widths
         for col in ['A', 'B', 'C', 'D', 'E']:
             sheet.column_dimensions[col].width = 15
+        
+        # Write formatted headers
+        sheet.append(self._header_row(
+            sheet,
+            DAILY_HEADERS,
+            _HEADER_FONT,
+            _HEADER_FILL_GREEN,
+            _CENTER_H,
+        ))
     
     
     def log_application(
@@ -190,97 +386,93 @@ class JobLogger:
             application_url: Link to the job posting
             notes: Error messages or important details only
         """
-        sheet = self.workbook["Applications"]
+        self._append_application(
+            job_title, company, resume_used, status, location, application_url, notes, platform
+        )
+        self._mark_dirty()
+        
+        print(f"✅ Logged: {job_title} at {company} ({status})")
+    
+    
+    def log_application_batch(self, rows: List[Dict]):
+        """
+        Log several applications, counted as one batch of unsaved changes.
+        
+        Args:
+            rows: List of dicts with the same keys as log_application()
+        """
+        if not rows:
+            return
+        
+        for row in rows:
+            self._append_application(
+                row["job_title"],
+                row["company"],
+                row["resume_used"],
+                row.get("status", "Success"),
+                row.get("location", "Not specified"),
+                row.get("application_url", ""),
+                row.get("notes", ""),
+                row.get("platform"),
+            )
         
+        self._mark_dirty(len(rows))
+        
+        for row in rows:
+            print(f"✅ Logged: {row['job_title']} at {row['company']} ({row.get('status', 'Success')})")
+    
+    
+    def _append_application(
+        self,
+        job_title: str,
+        company: str,
+        resume_used: str,
+        status: str,
+        location: str,
+        application_url: str,
+        notes: str,
+        platform: Optional[str] = None
+    ):
+        """
+        Append one row to the CSV sidecar (buffered; styled in the workbook on close).
+        """
         # Prepare data - cleaner format
         now = datetime.now()
+        today = self._today(now)
         
         # Create meaningful result details
-        result_details = ""
-        if status == "Success":
-            result_details = "✓ Application submitted successfully"
-        elif "Failed" in status:
-            result_details = f"✗ {notes}" if notes else "✗ Application failed"
-        elif status == "Skipped":
-            result_details = f"○ Skipped - {notes}" if notes else "○ Skipped (not Easy Apply)"
-        else:
-            result_details = notes
+        result_details = _status_handler(status)[0](notes)
         
-        row_data = [
-            now.strftime("%Y-%m-%d %H:%M"),     # Date with time
+        row_data = (
+            f"{today} {now:%H:%M}",              # Date with time
             job_title,                           # Job Title
             company,                             # Company
             location,                            # Location
-            resume_used.replace('.pdf', ''),    # Resume (clean name)
+            resume_used.removesuffix('.pdf'),   # Resume (clean name)
             status,                              # Status
             application_url,                     # URL
-            result_details                       # Result Details
-        ]
-        
-        # Append to sheet
-        sheet.append(row_data)
-        
-        # Color code status
-        status_row = sheet.max_row
-        status_cell = sheet.cell(row=status_row, column=6)  # Column F (Status)
-        
-        if status == "Success":
-            status_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            status_cell.font = Font(color="006100", bold=True)
-        elif "Failed" in status:
-            status_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            status_cell.font = Font(color="9C0006", bold=True)
-        else:  # Skipped
-            status_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-            status_cell.font = Font(color="9C6500")
-        
-        # Save workbook
-        self.workbook.save(self.excel_path)
+            result_details,                      # Result Details
+        )
         
-        print(f"✅ Logged: {job_title} at {company} ({status})")
+        self._csv_writer.writerow(row_data)
+        self._count_row(row_data, platform)
     
     
     def update_daily_summary(self):
         """
         Update the daily summary with today's statistics.
         """
-        apps_sheet = self.workbook["Applications"]
-        daily_sheet = self.workbook["Daily Summary"]
-        
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._today()
         
-        # Count today's applications
-        total = 0
-        success = 0
-        failed = 0
-        
-        for row in apps_sheet.iter_rows(min_row=2, values_only=True):
-            if row[0] == today:  # Check date column
-                total += 1
-                if row[9] == "Success":  # Status column
-                    success += 1
-                elif row[9] == "Failed":
-                    failed += 1
+        # Today's counts are kept up to date as rows are logged
+        total = self._counters['today'][today]
+        success = self._counters['today_success'][today]
+        failed = self._counters['today_failed'][today]
         
         success_rate = (success / total * 100) if total > 0 else 0
         
-        # Check if today already has an entry
-        existing_row = None
-        for row_num, row in enumerate(daily_sheet.iter_rows(min_row=2, values_only=True), start=2):
-            if row[0] == today:
-                existing_row = row_num
-                break
-        
-        # Update or append
-        if existing_row:
-            daily_sheet[f'B{existing_row}'] = total
-            daily_sheet[f'C{existing_row}'] = success
-            daily_sheet[f'D{existing_row}'] = failed
-            daily_sheet[f'E{existing_row}'] = f"{success_rate:.1f}%"
-        else:
-            daily_sheet.append([today, total, success, failed, f"{success_rate:.1f}%"])
-        
-        self.workbook.save(self.excel_path)
+        # Update or add today's entry (written to the Daily Summary sheet on close)
+        self._daily[today] = [today, total, success, failed, f"{success_rate:.1f}%"]
     
     
     def get_today_count(self, platform: Optional[str] = None) -> int:
@@ -293,16 +485,28 @@ class JobLogger:
         Returns:
             Number of applications today
         """
-        sheet = self.workbook["Applications"]
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._today()
         
-        count = 0
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if row[0] == today:  # Date column
-                if platform is None or row[4] == platform:  # Platform column
-                    count += 1
+        if platform is None:
+            return self._counters['today'][today]
+        # The tracker doesn't store the platform, so this covers rows logged since startup
+        return self._counters['today_platform'][(today, platform)]
+    
+    
+    def get_applied_urls(self) -> List[str]:
+        """
+        Get the application URLs of every logged job.
         
-        return count
+        Returns:
+            List of job posting URLs (empty entries skipped)
+        """
+        
+        url = COL['url']
+        return [
+            row[url]
+            for row in self._iter_rows()
+            if len(row) > url and row[url]
+        ]
     
     
     def get_statistics(self) -> Dict[str, any]:
@@ -312,30 +516,10 @@ class JobLogger:
         Returns:
             Dictionary with various statistics
         """
-        sheet = self.workbook["Applications"]
-        
-        total = 0
-        success = 0
-        failed = 0
-        by_platform = {}
-        by_resume = {}
-        
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            total += 1
-            
-            status = row[9]  # Status column
-            if status == "Success":
-                success += 1
-            elif status == "Failed":
-                failed += 1
-            
-            # Count by platform
-            platform = row[4]
-            by_platform[platform] = by_platform.get(platform, 0) + 1
-            
-            # Count by resume
-            resume = row[6]
-            by_resume[resume] = by_resume.get(resume, 0) + 1
+        counters = self._counters
+        total = counters['total']
+        success = counters['success']
+        failed = counters['failed']
         
         success_rate = (success / total * 100) if total > 0 else 0
         
@@ -345,8 +529,8 @@ class JobLogger:
             'failed': failed,
             'pending': total - success - failed,
             'success_rate': success_rate,
-            'by_platform': by_platform,
-            'by_resume': by_resume,
+            'by_platform': dict(counters['by_platform']),
+            'by_resume': dict(counters['by_resume']),
         }
     
     
@@ -360,29 +544,28 @@ class JobLogger:
         Returns:
             List of application dictionaries
         """
-        sheet = self.workbook["Applications"]
         
         applications = []
-        rows = list(sheet.iter_rows(min_row=2, values_only=True))
+        # Only the last N rows are kept while streaming the sidecar. Reading the file
+        # backwards isn't safe: quoted CSV fields (error notes) may span several lines.
+        rows = deque((row for row in self._iter_rows() if len(row) >= len(COL)), maxlen=max(limit, 0))
         
-        # Get last N rows (most recent)
-        for row in rows[-limit:]:
+        # Most recent first
+        for row in reversed(rows):
+            date = str(row[COL['date']])
             applications.append({
-                'date': row[0],
-                'time': row[1],
-                'job_title': row[2],
-                'company': row[3],
-                'platform': row[4],
-                'location': row[5],
-                'resume_used': row[6],
-                'match_score': row[7],
-                'confidence': row[8],
-                'status': row[9],
-                'url': row[10],
-                'notes': row[11],
+                'date': date[:10],
+                'time': date[11:],
+                'job_title': row[COL['title']],
+                'company': row[COL['company']],
+                'location': row[COL['location']],
+                'resume_used': row[COL['resume']],
+                'status': row[COL['status']],
+                'url': row[COL['url']],
+                'notes': row[COL['details']],
             })
         
-        return list(reversed(applications))  # Most recent first
+        return applications
     
     
     def log_error(
@@ -410,12 +593,39 @@ class JobLogger:
         )
     
     
+    def _mark_dirty(self, changes: int = 1):
+        """
+        Record unsaved changes and save once enough have piled up.
+        """
+        self._pending += changes
+        if self._pending >= self._flush_every:
+            self.flush()
+    
+    
+    def flush(self):
+        """
+        Push buffered rows to the CSV sidecar now (a checkpoint).
+        """
+        if self._pending:
+            self._csv_file.flush()
+            self._pending = 0
+    
+    
     def close(self):
         """
-        Save and close the workbook.
+        Close the sidecar and write the Excel tracker (safe to call more than once).
         """
-        self.workbook.save(self.excel_path)
-        self.workbook.close()
+        if self._closed:
+            return
+        self._closed = True
+        self._csv_file.close()
+        self._pending = 0
+        try:
+            self._write_workbook()
+        except Exception as e:
+            # The CSV still has every row; the workbook is rebuilt from it next time
+            print(f"⚠️ Could not write {self.excel_path}: {e}")
+            return
         print("💾 Logger saved and closed")
 
 
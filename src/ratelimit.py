@@ -0,0 +1,44 @@
+"""
+⏱️ RATE LIMITER
+Global pacing for requests to LinkedIn.
+A token bucket lets concurrent tasks run freely up to the cap and only
+waits when the cap is actually reached (instead of fixed per-call sleeps).
+"""
+
+import asyncio
+
+
+class AsyncTokenBucket:
+    def __init__(self, rate_per_sec: float = 1.0, burst: int = 1):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate_per_sec: Tokens added per second (sustained request rate)
+            burst: Maximum tokens that can accumulate (short bursts allowed)
+        """
+        self.rate = max(rate_per_sec, 1e-6)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = None
+        self._lock = asyncio.Lock()
+
+
+    async def acquire(self):
+        """
+        Take one token, waiting until one is available.
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self.updated_at is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # Sleep just long enough for the next token; holding the lock keeps waiters in FIFO order
+                await asyncio.sleep((1 - self.tokens) / self.rate)
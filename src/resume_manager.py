@@ -3,15 +3,111 @@
 Handles all resume-related operations:
 - Discovers PDFs in data/resumes/
 - Extracts clean text from PDFs
-- Caches results to avoid re-parsing
+- Caches results to avoid re-parsing (text kept on disk, read on demand)
 - Provides resume metadata for LLM matching
 """
 
 import os
+import re
 import json
+import mmap
+import pickle
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-import PyPDF2
+from typing import Dict, List, Optional, Set, Tuple
+
+# Prefer PDFium (C++) for text extraction; PyPDF2 (pure Python) is the fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    import PyPDF2
+
+# Whitespace around a line break (blank lines included) -> one newline; runs of spaces -> one space
+_CLEAN_RE = re.compile(r'\s*[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]\s*| +')
+# Common encoding issues: smart apostrophe, en dash, em dash, smart quotes (left / right)
+_TEXT_FIXES = str.maketrans({
+    '\u2019': "'",
+    '\u2013': "-",
+    '\u2014': "--",
+    '\u201c': '"',
+    '\u201d': '"',
+})
+
+
+def _extract_text_from_pdf(pdf_path: Path) -> str:
+    """
+    Extract text from a PDF file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Extracted text content (cleaned)
+    """
+    # One handler per document (the open/parse errors propagate to _parse_one)
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            text_content = [page.get_textpage().get_text_range() for page in pdf]
+        except Exception as e:
+            print(f"      ⚠️ Warning: Failed to read pages of {pdf_path.name}: {e}")
+            text_content = []
+        finally:
+            pdf.close()
+    else:
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            try:
+                text_content = [page.extract_text() or "" for page in pdf_reader.pages]
+            except Exception as e:
+                print(f"      ⚠️ Warning: Failed to read pages of {pdf_path.name}: {e}")
+                text_content = []
+    
+    # Join all pages and clean up
+    full_text = "\n\n".join(page_text for page_text in text_content if page_text)
+    cleaned_text = _clean_text(full_text)
+    
+    return cleaned_text
+
+
+def _clean_text(text: str) -> str:
+    """
+    Clean extracted text (remove extra whitespace, fix encoding issues).
+    """
+    # Strip lines, drop empty ones and collapse spaces in a single regex pass
+    text = _CLEAN_RE.sub(lambda m: '\n' if m.group(0).strip(' ') else ' ', text)
+    
+    # Fix common encoding issues (one pass)
+    return text.translate(_TEXT_FIXES).strip()
+
+
+def _parse_one(pdf_path: Path, txt_path: Path) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Parse one PDF and write its cleaned text to txt_path (top-level so it can run
+    in a worker process; only the word count travels back).
+    
+    Returns:
+        (word_count, None) on success, (None, error message) on failure
+    """
+    try:
+        text = _extract_text_from_pdf(pdf_path)
+        txt_path.write_text(text, encoding='utf-8')
+        return len(text.split()), None
+    except Exception as e:
+        return None, str(e)
+
+
+# Decoded texts of the last few resumes read (keyed by path + sig, so edits invalidate)
+@functools.lru_cache(maxsize=4)
+def _read_text(txt_path: str, sig: Tuple[int, int]) -> str:
+    """Read a cached resume text through a read-only memory map."""
+    with open(txt_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode('utf-8')
 
 
 class ResumeManager:
@@ -23,7 +119,11 @@ class ResumeManager:
             resumes_dir: Path to folder containing resume PDFs
         """
         self.resumes_dir = Path(resumes_dir)
-        self.cache_file = self.resumes_dir / ".resume_cache.json"
+        # Binary cache (local only); the old JSON cache is only read when there is no pickle yet
+        # and is left in place (it is tracked in git)
+        self.cache_file = self.resumes_dir / ".resume_cache.pkl"
+        self.legacy_cache_file = self.resumes_dir / ".resume_cache.json"
+        self.text_dir = self.resumes_dir / ".cache"
         self.resumes: Dict[str, Dict] = {}
         
         # Create directory if it doesn't exist
@@ -37,11 +137,19 @@ class ResumeManager:
         """
         Load resumes from cache or parse PDFs if cache is stale.
         """
+        cached_data: Dict[str, Dict] = {}
+        
         # Try to load from cache first
-        if self.cache_file.exists():
+        if self.cache_file.exists() or self.legacy_cache_file.exists():
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                if self.cache_file.exists():
+                    with open(self.cache_file, 'rb') as f:
+                        cached_data = pickle.load(f)
+                else:
+                    with open(self.legacy_cache_file, 'r', encoding='utf-8') as f:
+                        cached_data = json.load(f)
+                    # Legacy entries carry no sig, so they are reparsed below and the cache is
+                    # written once, in the binary format, after that
                 
                 # Verify cache is still valid (files haven't changed)
                 if self._is_cache_valid(cached_data):
@@ -50,27 +158,59 @@ class ResumeManager:
                     return
             except Exception as e:
                 print(f"⚠️ Cache corrupted, rebuilding: {e}")
+                cached_data = {}
         
-        # Cache miss or invalid - scan and parse all PDFs
+        # Cache miss or partly stale - keep unchanged entries, parse only new/edited PDFs
         print("🔍 Scanning for resume PDFs...")
-        self._scan_and_parse_pdfs()
+        current = self._file_signatures()
+        changed = {name for name, sig in current.items() if not self._entry_matches(cached_data.get(name), sig)}
+        self.resumes = {name: cached_data[name] for name in current if name not in changed}
+        self._scan_and_parse_pdfs(changed)
         self._save_cache()
     
     
+    def _file_signatures(self) -> Dict[str, List[int]]:
+        """
+        Fingerprint every PDF by [size, mtime_ns] (changes when a file is edited in place).
+        """
+        signatures = {}
+        for pdf_path in self.resumes_dir.glob("*.pdf"):
+            stat = pdf_path.stat()
+            signatures[pdf_path.name] = [stat.st_size, stat.st_mtime_ns]
+        return signatures
+    
+    
+    @staticmethod
+    def _entry_matches(entry: Optional[Dict], sig: List[int]) -> bool:
+        """
+        Check whether a cached entry was parsed from the file with this fingerprint.
+        """
+        return (
+            isinstance(entry, dict)
+            and entry.get('sig') == sig
+            and bool(entry.get('txt_path'))
+            and os.path.exists(entry['txt_path'])
+        )
+    
+    
     def _is_cache_valid(self, cached_data: Dict) -> bool:
         """
         Check if cached data matches current PDF files.
         """
-        pdf_files = set(f.name for f in self.resumes_dir.glob("*.pdf"))
-        cached_files = set(cached_data.keys())
+        current = self._file_signatures()
         
-        # Cache is valid if file lists match
-        return pdf_files == cached_files
+        # Cache is valid if file lists match and no file changed since it was parsed
+        return set(current) == set(cached_data) and all(
+            self._entry_matches(cached_data[name], sig) for name, sig in current.items()
+        )
     
     
-    def _scan_and_parse_pdfs(self):
+    def _scan_and_parse_pdfs(self, changed: Optional[Set[str]] = None):
         """
         Find all PDFs and extract their text content.
+        
+        Args:
+            changed: Only (re)parse these filenames; None parses every PDF
         """
         pdf_files = list(self.resumes_dir.glob("*.pdf"))
         
@@ -79,77 +219,41 @@ class ResumeManager:
             print(f"   Please add resume PDFs like: frontend.pdf, backend.pdf, fullstack.pdf")
             return
         
-        for pdf_path in pdf_files:
-            try:
-                print(f"📄 Parsing {pdf_path.name}...")
-                text = self._extract_text_from_pdf(pdf_path)
-                
-                # Store resume data
-                self.resumes[pdf_path.name] = {
-                    'filename': pdf_path.name,
-                    'path': str(pdf_path.absolute()),
-                    'text': text,
-                    'word_count': len(text.split()),
-                    'size_kb': pdf_path.stat().st_size / 1024
-                }
-                
-                print(f"   ✓ Extracted {len(text.split())} words")
-                
-            except Exception as e:
-                print(f"   ❌ Failed to parse {pdf_path.name}: {e}")
+        if changed is not None:
+            pdf_files = [p for p in pdf_files if p.name in changed]
+            if not pdf_files:
+                print(f"\n✅ Successfully loaded {len(self.resumes)} resumes")
+                return
         
-        print(f"\n✅ Successfully loaded {len(self.resumes)} resumes")
-    
-    
-    def _extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """
-        Extract text from a PDF file.
+        # PyPDF2 is pure Python (GIL-bound), so independent PDFs are parsed in separate processes
+        print(f"📄 Parsing {', '.join(p.name for p in pdf_files)}...")
+        self.text_dir.mkdir(parents=True, exist_ok=True)
+        txt_paths = [self.text_dir / f"{p.name}.txt" for p in pdf_files]
+        if len(pdf_files) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(pdf_files), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(_parse_one, pdf_files, txt_paths))
+        else:
+            results = [_parse_one(pdf_files[0], txt_paths[0])]
         
-        Args:
-            pdf_path: Path to the PDF file
+        for pdf_path, txt_path, (word_count, error) in zip(pdf_files, txt_paths, results):
+            if error is not None:
+                print(f"   ❌ Failed to parse {pdf_path.name}: {error}")
+                continue
             
-        Returns:
-            Extracted text content (cleaned)
-        """
-        text_content = []
-        
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
+            # Store resume metadata (the text itself stays in txt_path)
+            stat = pdf_path.stat()
+            self.resumes[pdf_path.name] = {
+                'filename': pdf_path.name,
+                'path': str(pdf_path.absolute()),
+                'txt_path': str(txt_path.absolute()),
+                'word_count': word_count,
+                'size_kb': stat.st_size / 1024,
+                'sig': [stat.st_size, stat.st_mtime_ns],
+            }
             
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                except Exception as e:
-                    print(f"      ⚠️ Warning: Failed to read page {page_num + 1}: {e}")
-        
-        # Join all pages and clean up
-        full_text = "\n\n".join(text_content)
-        cleaned_text = self._clean_text(full_text)
-        
-        return cleaned_text
-    
-    
-    def _clean_text(self, text: str) -> str:
-        """
-        Clean extracted text (remove extra whitespace, fix encoding issues).
-        """
-        # Replace multiple newlines with double newline
-        text = '\n'.join(line.strip() for line in text.splitlines() if line.strip())
-        
-        # Remove excessive spaces
-        import re
-        text = re.sub(r' +', ' ', text)
+            print(f"   ✓ {pdf_path.name}: extracted {word_count} words")
         
-        # Fix common encoding issues
-        text = text.replace('\u2019', "'")  # Smart apostrophe
-        text = text.replace('\u2013', "-")  # En dash
-        text = text.replace('\u2014', "--") # Em dash
-        text = text.replace('\u201c', '"')  # Smart quote left
-        text = text.replace('\u201d', '"')  # Smart quote right
-        
-        return text.strip()
+        print(f"\n✅ Successfully loaded {len(self.resumes)} resumes")
     
     
     def _save_cache(self):
@@ -157,8 +261,11 @@ class ResumeManager:
         Save parsed resumes to cache file.
         """
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.resumes, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in, so a crash never leaves a half-written cache
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.resumes, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
             print(f"💾 Cache saved to {self.cache_file}")
         except Exception as e:
             print(f"⚠️ Could not save cache: {e}")
@@ -175,17 +282,26 @@ class ResumeManager:
             Resume text or None if not found
         """
         resume = self.resumes.get(filename)
-        return resume['text'] if resume else None
+        if not resume:
+            return None
+        try:
+            return _read_text(resume['txt_path'], tuple(resume['sig']))
+        except OSError as e:
+            print(f"⚠️ Could not read cached text for {filename}: {e}")
+            return None
     
     
     def get_all_resumes(self) -> Dict[str, Dict]:
         """
-        Get all loaded resumes with their metadata.
+        Get all loaded resumes with their metadata and text.
         
         Returns:
-            Dictionary of {filename: resume_data}
+            Dictionary of {filename: resume_data} (each with a 'text' key)
         """
-        return self.resumes
+        return {
+            filename: {**resume, 'text': self.get_resume_text(filename) or ""}
+            for filename, resume in self.resumes.items()
+        }
     
     
     def get_resume_summary(self, filename: str) -> Optional[Dict]:
@@ -225,6 +341,7 @@ class ResumeManager:
         Use this if you've added/modified resume PDFs.
         """
         print("🔄 Force reloading all resumes...")
+        self.resumes = {}
         self._scan_and_parse_pdfs()
         self._save_cache()
     
@@ -0,0 +1,73 @@
+"""
+🗂️ TAB POOL
+A fixed set of tabs in the one shared browser context, lent out one job at a time.
+The browser and its persistent profile (LinkedIn session) are launched once per run;
+jobs borrow an already-open tab instead of opening a browser, context or tab each.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class TabPool:
+    def __init__(self, pages=()):
+        """
+        Initialize the pool.
+
+        Args:
+            pages: Existing tabs to lend out too (left open by close())
+        """
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._opened = []
+        self.size = 0
+        for page in pages:
+            self._add(page)
+
+
+    def _add(self, page):
+        self._idle.put_nowait(page)
+        self.size += 1
+
+
+    async def grow(self, open_tab, size: int, label: str = "tab"):
+        """
+        Open tabs until the pool holds `size` of them (stops at the first failure).
+
+        Args:
+            open_tab: Coroutine function returning a new tab in the shared context
+            size: Number of tabs wanted in total (= jobs in flight at once)
+            label: Name used in the warning if a tab can't be opened
+        """
+        while self.size < size:
+            try:
+                page = await open_tab()
+            except Exception as e:
+                print(f"⚠️ Could not open extra {label}:", e)
+                break
+            self._opened.append(page)
+            self._add(page)
+        return self
+
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Borrow a tab for one job; waits while every tab is busy.
+        """
+        page = await self._idle.get()
+        try:
+            yield page
+        finally:
+            self._idle.put_nowait(page)
+
+
+    async def close(self):
+        """
+        Close the tabs this pool opened (the ones passed in belong to the caller).
+        """
+        for page in self._opened:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._opened.clear()
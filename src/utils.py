@@ -1,76 +1,234 @@
-import time
 import random
 import math
+import time
+import re
+import asyncio
+import functools
+import logging
+import weakref
+
+import numpy as np
+from playwright.async_api import Error as PlaywrightError
+
+from src.config import DRY_RUN
+
+# Helper failures are expected (elements come and go) and non-fatal: logged at DEBUG,
+# so nothing is formatted unless debugging is switched on (BOT_DEBUG=1)
+log = logging.getLogger(__name__)
+
+# Vectorised sampling for the per-character / per-point loops (one call per batch)
+_rng = np.random.default_rng()
+_TYPO_CHARS = 'qwertyuiopasdfghjklzxcvbnm'
 
 # ============================================================
 #  HUMANIZATION LAYER - AVOID DETECTION
 # ============================================================
 
-def human_sleep(min_seconds=2, max_seconds=5, variance=0.3):
+async def _pause(page, seconds):
     """
-    Advanced sleep with occasional 'distraction' pauses.
+    Page-side pause between actions: waits through Playwright so the connection
+    keeps processing page events while we "hesitate".
+    """
+    await page.wait_for_timeout(seconds * 1000)
+
+
+async def human_sleep(min_seconds=2, max_seconds=5, sigma=0.35, hard_cap=None):
+    """
+    Sleep for a human-looking, long-tailed duration.
+    Awaitable, so other tabs keep working while this one "waits".
+    
+    The duration is log-normal around the middle of the range, clipped to
+    [min_seconds, hard_cap]: mostly close to the midpoint, sometimes longer,
+    but never the old 2-8 s "distraction" spikes on top.
     
     Args:
         min_seconds: Minimum sleep time
-        max_seconds: Maximum sleep time
-        variance: Probability (0-1) of adding extra distraction delay
+        max_seconds: Maximum "typical" sleep time
+        sigma: Spread of the log-normal (higher = heavier tail)
+        hard_cap: Longest allowed sleep (default 1.5x max_seconds)
     """
-    base_sleep = random.uniform(min_seconds, max_seconds)
+    # Nothing is submitted in a dry run, so there is no one to look human for
+    if DRY_RUN:
+        return
     
-    # 30% chance of "getting distracted" (extra 2-8 sec pause)
-    if random.random() < variance:
-        distraction = random.uniform(2, 8)
-        base_sleep += distraction
+    cap = max_seconds * 1.5 if hard_cap is None else hard_cap
+    duration = _rng.lognormal(mean=math.log((min_seconds + max_seconds) / 2), sigma=sigma)
     
-    time.sleep(base_sleep)
+    await asyncio.sleep(min(max(duration, min_seconds), cap))
+
+
+# Sets a field's value in one round-trip. Goes through the native value setter and fires
+# input/change so React-controlled inputs pick it up (plain el.value = v is ignored by React).
+_SET_VALUE_JS = """
+(el, value) => {
+    el.focus();
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+}
+"""
+_SLOW_CHARS = set('!@#$%^&*()_+-={}[]|\\:";\'<>?,./')
+_BACKSPACE_KEY = {'key': 'Backspace', 'code': 'Backspace', 'windowsVirtualKeyCode': 8}
+
+# One CDP session per page, opened on the first slow-typed field and reused after that
+_cdp_sessions = weakref.WeakKeyDictionary()
+
+
+async def _cdp_session(page):
+    """Raw DevTools session for a (Chromium) page, or None if the browser has none."""
+    if page not in _cdp_sessions:
+        try:
+            _cdp_sessions[page] = await page.context.new_cdp_session(page)
+        except Exception:
+            _cdp_sessions[page] = None
+    return _cdp_sessions[page]
+
+
+async def _dispatch_key(cdp, key, timestamp):
+    """
+    Send one keystroke (down + up) through CDP without waiting between the two.
+    A key with 'text' types that character; one without is a control key (Backspace).
+    """
+    down = dict(key, type='keyDown' if 'text' in key else 'rawKeyDown', timestamp=timestamp)
+    up = {'type': 'keyUp', 'key': key['key'], 'timestamp': timestamp}
+    await asyncio.gather(
+        cdp.send('Input.dispatchKeyEvent', down),
+        cdp.send('Input.dispatchKeyEvent', up),
+    )
+
 
+# Typing style per kind of field: (delay_min, delay_max, mistake_probability, pause_probability).
+# Nobody mistypes their own email or phone number; long free text gets slower, thinking typing.
+TYPING_PROFILES = {
+    'email': (20, 60, 0.0, 0.0),
+    'phone': (40, 90, 0.0, 0.05),
+    'cover': (60, 120, 0.03, 0.1),
+}
+_DEFAULT_TYPING = (50, 150, 0.05, 0.15)
+# Selector patterns that pick a profile (checked in order)
+_TYPING_PROFILE_PATTERNS = [
+    (re.compile(r"email", re.I), 'email'),
+    (re.compile(r"phone|mobile|\btel\b", re.I), 'phone'),
+    (re.compile(r"cover|letter|message|textarea", re.I), 'cover'),
+]
 
-def human_type(page, selector, text, delay_min=50, delay_max=150, 
-               mistake_probability=0.05, pause_probability=0.15):
+
+@functools.lru_cache(maxsize=128)
+def _typing_profile(selector):
+    """Typing settings for a selector (resolved once per selector string)."""
+    for pattern, kind in _TYPING_PROFILE_PATTERNS:
+        if pattern.search(selector):
+            return TYPING_PROFILES[kind]
+    return _DEFAULT_TYPING
+
+
+async def _resolve(page, selector):
+    """
+    Element to act on, resolved once: every call on the returned handle reuses it instead
+    of re-running the selector. A Locator / ElementHandle passed in is used as is.
+    """
+    return await page.wait_for_selector(selector) if isinstance(selector, str) else selector
+
+
+async def human_type(page, selector, text, delay_min=None, delay_max=None, 
+               mistake_probability=None, pause_probability=None, fast=False):
     """
     Types with realistic human behavior:
     - Random typing speed variations
     - Occasional typos + backspace corrections
     - Random pauses (like thinking)
     
+    selector may also be an already-resolved Locator / ElementHandle.
+    Settings left as None come from the field's TYPING_PROFILES entry (guessed from
+    the selector: email / phone / cover letter), else the defaults below.
+    
     Args:
+        delay_min, delay_max: Per-keystroke delay range in ms (50-150 default)
         mistake_probability: Chance to make a typo per character (5% default)
         pause_probability: Chance to pause mid-typing (15% default)
+        fast: Set the whole value in one call (no key events, no human timing).
+              Opt-in for hot paths where keystrokes don't matter; leave False for
+              anything that should look typed or reacts to keypresses
     """
     try:
-        element = page.locator(selector)
-        element.click()  # Focus the field first
-        human_sleep(0.1, 0.3)
+        element = await _resolve(page, selector)
+        await element.click()  # Focus the field first
+        await human_sleep(0.1, 0.3)
+        
+        if fast:
+            await element.evaluate(_SET_VALUE_JS, text)
+            return
+        
+        delay_min, delay_max, mistake_probability, pause_probability = (
+            default if value is None else value
+            for value, default in zip(
+                (delay_min, delay_max, mistake_probability, pause_probability),
+                _typing_profile(selector) if isinstance(selector, str) else _DEFAULT_TYPING,
+            )
+        )
+        
+        # Plan the whole keystroke schedule up front, drawing each random quantity as one batch
+        n = len(text)
+        slow = np.fromiter((char in _SLOW_CHARS for char in text), dtype=bool, count=n)
+        # Variable typing speed (humans slow down on complex chars), ms -> seconds
+        delays = _rng.uniform(
+            np.where(slow, delay_max, delay_min), np.where(slow, delay_max * 1.5, delay_max)
+        ) / 1000
+        # Random pauses (like thinking or reading)
+        pauses = np.where(_rng.random(n) < pause_probability, _rng.uniform(0.3, 1.2, n), 0.0)
+        waits = (delays + pauses).tolist()
+        # Occasional typos: which characters, the wrong key and the two correction pauses
+        # (nothing to draw for typo-free profiles)
+        typos = (_rng.random(n) < mistake_probability).tolist() if mistake_probability else None
+        if typos:
+            wrong_keys = _rng.integers(len(_TYPO_CHARS), size=n).tolist()
+            typo_pauses = _rng.uniform(0.1, 0.3, n).tolist()
+            backspace_pauses = _rng.uniform(0.05, 0.15, n).tolist()
+        
+        # Keystrokes go straight to the browser's input queue over CDP (two messages, sent
+        # together, instead of down/up round-trips); element.press() if CDP isn't available.
+        # The timestamps only label the events - the browser doesn't delay them - so the
+        # planned pauses are still slept here.
+        cdp = await _cdp_session(page)
+        clock = time.time()
+        
+        async def press(char, key=None):
+            if cdp is None or (key is None and not char.isprintable()):
+                await element.press(char)
+            else:
+                await _dispatch_key(cdp, key or {'key': char, 'text': char}, clock)
         
         for i, char in enumerate(text):
             # Occasionally make a typo
-            if random.random() < mistake_probability:
-                wrong_char = random.choice('qwertyuiopasdfghjklzxcvbnm')
-                element.press(wrong_char)
-                time.sleep(random.uniform(0.1, 0.3))
-                element.press('Backspace')
-                time.sleep(random.uniform(0.05, 0.15))
+            if typos and typos[i]:
+                await press(_TYPO_CHARS[wrong_keys[i]])
+                clock += typo_pauses[i]
+                await asyncio.sleep(typo_pauses[i])
+                await press('Backspace', _BACKSPACE_KEY)
+                clock += backspace_pauses[i]
+                await asyncio.sleep(backspace_pauses[i])
             
             # Type the correct character
-            element.press(char)
-            
-            # Variable typing speed (humans slow down on complex chars)
-            if char in '!@#$%^&*()_+-={}[]|\\:";\'<>?,./':
-                delay = random.uniform(delay_max, delay_max * 1.5)
-            else:
-                delay = random.uniform(delay_min, delay_max)
-            
-            time.sleep(delay / 1000)  # Convert ms to seconds
-            
-            # Random pauses (like thinking or reading)
-            if random.random() < pause_probability:
-                time.sleep(random.uniform(0.3, 1.2))
+            await press(char)
+            clock += waits[i]
+            await asyncio.sleep(waits[i])
         
-    except Exception as e:
-        print(f"⚠️ Could not type in {selector}: {e}")
+    except Exception:
+        log.debug("Could not type in %s", selector, exc_info=True)
+
 
+_SCROLL_DIMENSIONS_JS = "() => [document.body.scrollHeight, window.innerHeight]"
+# One browser-animated scroll (smooth behaviour), resolved once it has had time to finish
+_SMOOTH_SCROLL_JS = """
+d => new Promise(resolve => {
+    window.scrollBy({ top: d, behavior: 'smooth' });
+    setTimeout(resolve, 300 + Math.random() * 200);
+})
+"""
 
-def human_scroll(page, read_time=True):
+
+async def human_scroll(page, read_time=True):
     """
     Scrolls like a human reading content:
     - Variable scroll speeds
@@ -78,143 +236,279 @@ def human_scroll(page, read_time=True):
     - Pauses to "read" sections
     """
     try:
-        # Get page height
-        page_height = page.evaluate("document.body.scrollHeight")
-        viewport_height = page.evaluate("window.innerHeight")
+        # Get page and viewport height in one round-trip
+        page_height, viewport_height = await page.evaluate(_SCROLL_DIMENSIONS_JS)
         
         current_position = 0
+        remeasures_left = 3  # bounded, so an infinite feed can't keep us scrolling forever
         
         # Scroll in chunks (like reading sections)
-        while current_position < page_height - viewport_height:
+        while True:
+            if current_position >= page_height - viewport_height:
+                # Lazy-loaded pages grow while we scroll: re-measure before stopping
+                if current_position == 0 or remeasures_left == 0:
+                    break
+                remeasures_left -= 1
+                page_height, viewport_height = await page.evaluate(_SCROLL_DIMENSIONS_JS)
+                if current_position >= page_height - viewport_height:
+                    break
+            
             # Random scroll distance (200-800px)
             scroll_distance = random.randint(200, 800)
             
-            # Smooth scroll with easing (not instant)
-            steps = random.randint(10, 20)
-            for step in range(steps):
-                micro_scroll = scroll_distance / steps
-                page.mouse.wheel(0, micro_scroll)
-                time.sleep(0.02)  # 20ms between micro-scrolls
+            # Smooth scroll with easing (not instant), animated by the browser itself
+            await page.evaluate(_SMOOTH_SCROLL_JS, scroll_distance)
             
             current_position += scroll_distance
             
             # Pause to "read" (if enabled)
             if read_time:
-                time.sleep(random.uniform(1, 3))
+                await _pause(page, random.uniform(1, 3))
             
             # 20% chance to scroll back up slightly (re-reading)
             if random.random() < 0.2:
-                page.mouse.wheel(0, -random.randint(50, 200))
-                time.sleep(random.uniform(0.5, 1.5))
+                await page.evaluate(_SMOOTH_SCROLL_JS, -random.randint(50, 200))
+                await _pause(page, random.uniform(0.5, 1.5))
         
         # Final pause at bottom
-        human_sleep(1, 2)
+        await human_sleep(1, 2)
         
-    except Exception as e:
-        print(f"⚠️ Scrolling failed: {e}")
+    except Exception:
+        log.debug("Scrolling failed", exc_info=True)
 
 
-def human_mouse_move(page, x, y, duration=0.5):
+# Last mouse position we moved to, per page (Playwright's mouse keeps it across navigations)
+_mouse_pos = weakref.WeakKeyDictionary()
+
+
+def _last_mouse_pos(page):
+    """Where the mouse was left on this page (viewport centre before the first move)."""
+    pos = _mouse_pos.get(page)
+    if pos is None:
+        viewport = page.viewport_size or {'width': 1920, 'height': 1080}
+        pos = (viewport['width'] / 2, viewport['height'] / 2)
+    return pos
+
+
+async def human_mouse_move(page, x, y, duration=0.5):
     """
     Moves mouse in a curved path (Bezier-like) instead of straight line.
     Mimics natural hand movement.
     """
     try:
-        # Get current mouse position
-        current_x = page.evaluate("window.mouseX || window.innerWidth / 2")
-        current_y = page.evaluate("window.mouseY || window.innerHeight / 2")
+        # Get current mouse position (tracked here, no round-trip)
+        current_x, current_y = _last_mouse_pos(page)
         
-        # Generate curve control points
-        control_x1 = current_x + random.uniform(-100, 100)
-        control_y1 = current_y + random.uniform(-100, 100)
-        control_x2 = x + random.uniform(-50, 50)
-        control_y2 = y + random.uniform(-50, 50)
+        # Generate curve control points (all four offsets in one draw)
+        dx1, dy1, dx2, dy2 = _rng.uniform([-100, -100, -50, -50], [100, 100, 50, 50]).tolist()
+        control_x1 = current_x + dx1
+        control_y1 = current_y + dy1
+        control_x2 = x + dx2
+        control_y2 = y + dy2
         
-        # Move in steps along the curve
+        # Move along the curve: a few Bezier waypoints, with Playwright interpolating
+        # the mouse events in between (one round-trip per segment, not per point)
         steps = random.randint(15, 30)
-        for i in range(steps + 1):
-            t = i / steps
-            # Cubic Bezier formula
-            bx = (1-t)**3 * current_x + 3*(1-t)**2*t * control_x1 + \
-                 3*(1-t)*t**2 * control_x2 + t**3 * x
-            by = (1-t)**3 * current_y + 3*(1-t)**2*t * control_y1 + \
-                 3*(1-t)*t**2 * control_y2 + t**3 * y
-            
-            page.mouse.move(bx, by)
-            time.sleep(duration / steps)
+        segments = random.randint(4, 6)
+        # Cubic Bezier formula, evaluated for every waypoint at once
+        t = np.arange(1, segments + 1) / segments
+        u = 1 - t
+        weights = np.stack([u**3, 3*u**2*t, 3*u*t**2, t**3])
+        bx = np.array([current_x, control_x1, control_x2, x]) @ weights
+        by = np.array([current_y, control_y1, control_y2, y]) @ weights
+        
+        for px, py in zip(bx.tolist(), by.tolist()):
+            await page.mouse.move(px, py, steps=max(1, steps // segments))
+            await _pause(page, duration / segments)
         
         # Store final position
-        page.evaluate(f"window.mouseX = {x}; window.mouseY = {y}")
+        _mouse_pos[page] = (x, y)
         
-    except Exception as e:
-        print(f"⚠️ Mouse move failed: {e}")
+    except Exception:
+        log.debug("Mouse move failed", exc_info=True)
 
 
-def human_click(page, selector, move_mouse=True):
+# human_click skips the curved approach when the target is closer than this to the mouse
+CLICK_MOVE_THRESHOLD_PX = 30
+
+
+async def human_click(page, selector, move_mouse=True):
     """
     Clicks with human-like behavior:
     - Moves mouse to element first
     - Slight position randomness (doesn't click center pixel)
     - Brief hover before click
+    
+    Args:
+        selector: CSS selector, or an already-resolved Locator / ElementHandle to reuse
+    
+    Returns:
+        True if the click went through, False if it failed (details logged at DEBUG)
     """
     try:
-        element = page.locator(selector)
-        box = element.bounding_box()
+        element = await _resolve(page, selector)
+        box = await element.bounding_box() if move_mouse else None
         
-        if box and move_mouse:
+        if box:
             # Click random point within element (not always center)
             click_x = box['x'] + box['width'] * random.uniform(0.3, 0.7)
             click_y = box['y'] + box['height'] * random.uniform(0.3, 0.7)
             
-            human_mouse_move(page, click_x, click_y, duration=random.uniform(0.3, 0.7))
-            time.sleep(random.uniform(0.1, 0.3))  # Brief hover
+            # Already (nearly) there - e.g. consecutive buttons in one panel: no travel, no hover
+            current_x, current_y = _last_mouse_pos(page)
+            distance = math.hypot(click_x - current_x, click_y - current_y)
+            if distance >= CLICK_MOVE_THRESHOLD_PX:
+                # Short hops take proportionally less time than crossing the screen
+                duration = min(random.uniform(0.3, 0.7), distance / 1000)
+                await human_mouse_move(page, click_x, click_y, duration=duration)
+                await _pause(page, random.uniform(0.1, 0.3))  # Brief hover
         
-        element.click()
-        human_sleep(0.5, 1.5)
+        await element.click()
+        await human_sleep(0.5, 1.5)
+        return True
         
-    except Exception as e:
-        print(f"⚠️ Could not click {selector}: {e}")
+    except Exception:
+        log.debug("Could not click %s", selector, exc_info=True)
+        return False
+
+
+# Hover-then-click inside the page: mousemove frames (one per animation frame) along a
+# straight, eased path from the last mouse position to a random point of the element,
+# mouseover on arrival, a short hover, then the click. Returns whether an element matched.
+_FAST_CLICK_JS = """
+async ([sel, startX, startY, frames, hoverMs]) => {
+    const el = document.querySelector(sel);
+    if (!el) return false;
+    el.scrollIntoView({ block: 'nearest' });
+    const r = el.getBoundingClientRect();
+    const x = r.left + r.width * (0.3 + Math.random() * 0.4);
+    const y = r.top + r.height * (0.3 + Math.random() * 0.4);
+    const fire = (target, type, px, py) => target.dispatchEvent(new MouseEvent(type, {
+        bubbles: true, cancelable: true, view: window, clientX: px, clientY: py }));
+    const frame = () => new Promise(requestAnimationFrame);
+    for (let i = 1; i <= frames; i++) {
+        await frame();
+        const t = i / frames, e = t * t * (3 - 2 * t);
+        const px = startX + (x - startX) * e, py = startY + (y - startY) * e;
+        fire(document.elementFromPoint(px, py) || document.body, 'mousemove', px, py);
+    }
+    fire(el, 'mouseover', x, y);
+    el.dispatchEvent(new MouseEvent('mouseenter', { view: window, clientX: x, clientY: y }));  // doesn't bubble
+    await new Promise(resolve => setTimeout(resolve, hoverMs));
+    el.click();
+    return true;
+}
+"""
 
 
-def random_micro_movements(page, duration=10):
+async def fast_click(page, selector):
     """
-    Simulates idle mouse movements (like a user reading).
-    Call this occasionally when the bot is "waiting" for pages to load.
+    Light version of human_click in one round-trip: the approach, hover and click
+    all run in the page as synthetic events.
+    Use for in-site navigation where bot checks are weak; keep human_click (real
+    input events) for login and the application form.
+    
+    Returns:
+        True if the element was found and clicked
     """
     try:
-        end_time = time.time() + duration
-        while time.time() < end_time:
+        start_x, start_y = _last_mouse_pos(page)
+        # Synthetic events only: the real mouse (and _mouse_pos) stays where it was
+        clicked = await page.evaluate(
+            _FAST_CLICK_JS,
+            [selector, start_x, start_y, random.randint(8, 15), random.randint(100, 300)],
+        )
+        if clicked:
+            await human_sleep(0.5, 1.5)
+        return clicked
+    except Exception:
+        log.debug("Fast click failed on %s", selector, exc_info=True)
+        return False
+
+
+async def _micro_movements(page, moves):
+    """Small wiggles around the current mouse position, with all randomness drawn up front."""
+    try:
+        offsets = _rng.integers([-50, -30], [51, 31], size=(moves, 2)).tolist()
+        steps = _rng.integers(3, 9, size=moves).tolist()
+        pauses = _rng.uniform(0.5, 2, size=moves).tolist()
+        x, y = _last_mouse_pos(page)
+        for (dx, dy), n, pause in zip(offsets, steps, pauses):
             # Small random movements
-            dx = random.randint(-50, 50)
-            dy = random.randint(-30, 30)
-            page.mouse.move(dx, dy, steps=random.randint(3, 8))
-            time.sleep(random.uniform(0.5, 2))
-    except:
-        pass
+            await page.mouse.move(x + dx, y + dy, steps=n)
+            _mouse_pos[page] = (x + dx, y + dy)
+            await _pause(page, pause)
+    except PlaywrightError:
+        log.debug("Idle mouse movement failed", exc_info=True)
+
 
+async def random_micro_movements(page, moves=3, background=True):
+    """
+    Simulates idle mouse movements (like a user reading).
+    Call this occasionally when the bot is "waiting" for pages to load.
+    
+    Args:
+        moves: Number of small movements to make
+        background: Return the running task instead of waiting for it, so the
+                    wiggles overlap with the page load; await it only if the
+                    delay itself is wanted
+    """
+    task = asyncio.create_task(_micro_movements(page, moves))
+    return task if background else await task
 
-def simulate_reading_pattern(page, selector):
+
+# Reading speed used by simulate_reading_pattern (characters per second) and the longest "read"
+READING_CHARS_PER_SEC = 20
+MAX_READING_SECONDS = 8
+
+
+async def simulate_reading_pattern(page, selector):
     """
-    Simulates reading text by moving mouse over it.
+    Simulates reading text: brings it into view, rests the mouse on it and
+    waits roughly as long as reading it would take.
     Use this for job descriptions before clicking "Apply".
     """
     try:
-        element = page.locator(selector)
-        box = element.bounding_box()
+        element = await _resolve(page, selector)
+        await element.scroll_into_view_if_needed()
         
-        if box:
-            # Start at top-left of text
-            x = box['x'] + 20
-            y = box['y'] + 10
-            
-            # Move across several "lines" of text
-            for line in range(random.randint(3, 6)):
-                # Move right (reading)
-                end_x = x + random.uniform(200, 400)
-                human_mouse_move(page, end_x, y, duration=random.uniform(0.8, 1.5))
-                
-                # Move down to next line
-                y += random.uniform(20, 35)
-                time.sleep(random.uniform(0.3, 0.8))
-    except:
-        pass
\ No newline at end of file
+        # Rest the mouse near the start of the text (one move instead of a path per "line")
+        await element.hover(position={'x': 20 + random.random() * 100, 'y': 10})
+        _mouse_pos.pop(page, None)  # hover position is element-relative; real spot unknown here
+        
+        # ~20 chars/s with jitter, capped so a long description doesn't stall the run
+        text = await element.inner_text()
+        seconds = len(text) / READING_CHARS_PER_SEC * random.uniform(0.8, 1.2)
+        await _pause(page, min(seconds, MAX_READING_SECONDS))
+    except PlaywrightError:
+        log.debug("Reading simulation failed on %s", selector, exc_info=True)
+
+
+async def apply_humanly(page, actions, max_parallel=3):
+    """
+    Runs independent human actions on one page side by side.
+    Wall time is about the slowest action instead of the sum of them.
+    
+    Args:
+        actions: Coroutine functions taking the page, or (resource, function) pairs.
+                 Actions naming the same resource ('mouse', 'scroll', 'keyboard', ...)
+                 run one after another; untagged ones only share the max_parallel cap
+        max_parallel: Most actions in flight at once
+    
+    Returns:
+        Each action's result (or the exception it raised), in order
+    """
+    sem = asyncio.Semaphore(max_parallel)
+    locks = {}
+    
+    async def _run(action):
+        resource, fn = action if isinstance(action, tuple) else (None, action)
+        lock = locks.setdefault(resource, asyncio.Lock()) if resource is not None else None
+        if lock is None:
+            async with sem:
+                return await fn(page)
+        # Wait for the resource first, so a queued action doesn't hold a parallel slot
+        async with lock, sem:
+            return await fn(page)
+    
+    return await asyncio.gather(*(_run(a) for a in actions), return_exceptions=True)